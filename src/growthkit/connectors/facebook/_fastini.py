@@ -0,0 +1,38 @@
+"""
+Minimal INI reader for the flat `facebook.ini` layout.
+
+Handles only `[section]` headers, `key = value` pairs, blank lines and full-line
+`#`/`;` comments. Anything else (continuation lines, `:` delimiters, keys
+outside a section) raises ValueError so the caller can fall back to
+`configparser`.
+
+Patterns run over the raw UTF-8 bytes; only the matched names and values are
+decoded, so the file is never materialised as a second, decoded copy.
+"""
+
+import re
+from typing import Iterator, Tuple
+
+_SECTION = re.compile(rb'^\[([^\]]+)\][ \t\r]*$', re.M)
+_KV = re.compile(rb'^([^=#;\s\[][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.M)
+# Indented continuation lines, or content lines without a `=` delimiter
+_UNSUPPORTED = re.compile(rb'^(?:[ \t]+\S|[^\[\s#;][^=\n]*$)', re.M)
+
+
+def parse(data: bytes) -> Iterator[Tuple[str, str, str]]:
+    """Yield `(section, key, value)` tuples from UTF-8 INI bytes, in file order."""
+    bad = _UNSUPPORTED.search(data)
+    if bad:
+        raise ValueError(f"Unsupported INI line: {bad.group(0)!r}")
+
+    headers = list(_SECTION.finditer(data))
+    if _KV.search(data, 0, headers[0].start() if headers else len(data)):
+        raise ValueError("Key/value pair found before the first section header")
+
+    for i, header in enumerate(headers):
+        # pos/endpos bound the scan to this section without slicing the buffer
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(data)
+        section = header.group(1).decode("utf-8")
+        for kv in _KV.finditer(data, header.end(), end):
+            # Match configparser's default optionxform, which lower-cases keys
+            yield section, kv.group(1).decode("utf-8").lower(), kv.group(2).decode("utf-8")
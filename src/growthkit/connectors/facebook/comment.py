@@ -9,7 +9,7 @@ Workflow:
 Requirements
 ------------
 * A long-lived **user access token** that has the `ads_read` permission (used for Ad→Post lookup).
-  We load this from the latest tokens-*.json file generated by `growthkit.connectors.facebook.tokens`.
+  We load this from the latest token file (tokens-latest.json) generated by `growthkit.connectors.facebook.tokens`.
 * Page access tokens (generated by the same tool) for comment lookup. If a post's Page ID
   isn't found in the token file, we fall back to the user token - this works as long as the 
   user token has `pages_read_user_content`.
@@ -6,14 +6,22 @@ at the repository root so the user has something to tweak.
 This module also includes TokenManager for handling dynamic token storage.
 """
 
-import json
+import os
+import re
 import sys
+import copy
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, List
-from dataclasses import asdict
-from configparser import ConfigParser
+from typing import Any, Callable, Optional, Dict, FrozenSet, List, Tuple
+from dataclasses import fields, replace
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the `speedups` extra
+    orjson = None
+
+from growthkit.connectors.facebook import _fastini
 from growthkit.connectors.facebook.schema import Config, Token, User, Page
 from growthkit.utils.style import ansi
 from growthkit.utils.logs import report
@@ -26,26 +34,153 @@ ROOT = Path(__file__).resolve().parent.parent.parent
 CONFIG = Path(ROOT, "config", "facebook")
 INI_FILE = Path(CONFIG, "facebook.ini")
 
+# Parsed configs keyed by INI path, invalidated when the file's mtime/size change
+_CACHE: Dict[Path, Tuple[Tuple[int, int], Config]] = {}
+
+# Defaults prototype (never mutated) and per-section field names from the schema
+_DEFAULTS = Config()
+_FIELDS: Dict[str, FrozenSet[str]] = {
+    sect.name: frozenset(f.name for f in fields(getattr(_DEFAULTS, sect.name)))
+    for sect in fields(Config)
+}
+
+
+# INI values that mean "unset" for Optional fields
+_NULL_RE = re.compile(r'\s*(?:None|none|null)?\s*')
+
 
 # Helpers
-def _cast(template_value, raw: str):
+def _caster_for(template_value) -> Callable[[str], Any]:
+    """Pick the callable that turns a raw INI string into the field's type."""
+    # Optional fields default to None; keep their values as plain strings
+    if template_value is None:
+        return str
+    # Covers Path too: type(Path(...)) is the concrete PosixPath/WindowsPath
+    return type(template_value)
+
+
+def _cast(caster: Callable[[str], Any], raw: str):
     """Cast the raw INI string back to the dataclass field type."""
     # Handle None/empty values for Optional fields
-    if raw.strip() in ('', 'None', 'none', 'null'):
+    if _NULL_RE.fullmatch(raw):
         return None
+    return caster(raw)
+
+
+# Field casters keyed by (section, key), resolved once instead of per INI entry
+_CASTERS: Dict[Tuple[str, str], Callable[[str], Any]] = {
+    (sect, key): _caster_for(getattr(getattr(_DEFAULTS, sect), key))
+    for sect, keys in _FIELDS.items()
+    for key in keys
+}
+
+
+def _intern(value):
+    """Intern short, frequently repeated strings (IDs, enum-like values)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _build_codec(cls, nested: Dict[str, Tuple[Callable, Callable]],
+                 interned: FrozenSet[str] = frozenset()) -> Tuple[Callable, Callable]:
+    """
+    Generate specialised to-dict/from-dict functions for a schema dataclass.
+
+    The field list is unrolled into straight-line source once at import time
+    (the same trick `dataclasses` uses for `__init__`), so each call is a single
+    dict display or constructor call with no `fields()`/`asdict()` walk.
+    `nested` maps field names to the (encode, decode) pair for dataclass-valued
+    fields; string fields named in `interned` are passed through `sys.intern`
+    on decode.
+    """
+    ns: Dict[str, Any] = {"_cls": cls, "_intern": _intern}
+    enc_items, dec_args = [], []
+    for f in fields(cls):
+        name = f.name
+        if name in nested:
+            ns[f"_enc_{name}"], ns[f"_dec_{name}"] = nested[name]
+            enc_items.append(f"{name!r}: _enc_{name}(o.{name})")
+            # Falsy nested values ({} or None) decode to None, as before
+            dec_args.append(f"_dec_{name}(d.get({name!r}) or None)")
+        else:
+            ns[f"_default_{name}"] = f.default
+            enc_items.append(f"{name!r}: o.{name}")
+            value = f"d.get({name!r}, _default_{name})"
+            dec_args.append(f"_intern({value})" if name in interned else value)
+
+    src = (
+        "def encode(o):\n"
+        "    if o is None:\n"
+        "        return None\n"
+        f"    return {{{', '.join(enc_items)}}}\n"
+        "def decode(d):\n"
+        "    if d is None:\n"
+        "        return None\n"
+        f"    return _cls({', '.join(dec_args)})\n"
+    )
+    exec(src, ns)  # pylint: disable=exec-used
+    return ns["encode"], ns["decode"]
+
+
+_encode_token, _decode_token = _build_codec(
+    Token, {}, frozenset({"token_type"}))
+_encode_user, _decode_user = _build_codec(
+    User, {"long_lived_token": (_encode_token, _decode_token)},
+    frozenset({"user_id", "user_name"}))
+_encode_page, _decode_page = _build_codec(
+    Page, {"page_access_token": (_encode_token, _decode_token)},
+    frozenset({"page_id", "category"}))
+
+
+# Field names per schema dataclass, for the stdlib encoder's default= hook
+_SCHEMA_FIELDS: Dict[type, Tuple[str, ...]] = {
+    cls: tuple(f.name for f in fields(cls)) for cls in (Token, User, Page)
+}
+
+
+def _json_default(o: Any) -> Dict[str, Any]:
+    """Let the JSON encoder serialize schema dataclasses (and nested Tokens) in its own walk."""
+    names = _SCHEMA_FIELDS.get(type(o))
+    if names is None:
+        raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+    return {name: getattr(o, name) for name in names}
+
+
+def _json_dumps(data: Any, indent: bool = True) -> bytes:
+    """Encode to UTF-8 JSON bytes, indented by 2 or compact on one line.
+
+    Schema dataclasses may be passed as-is: orjson serializes them natively and
+    the stdlib encoder goes through `_json_default`.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, default=_json_default, option=option)
+    import json
+
+    if indent:
+        return json.dumps(data, default=_json_default, indent=2,
+                          ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, default=_json_default, ensure_ascii=False,
+                      separators=(',', ':')).encode('utf-8')
 
-    # Handle None template values (Optional fields)
-    if template_value is None:
-        # For Optional fields, try to cast as string by default
-        # More sophisticated type inference could be added here
-        return raw
 
-    t = type(template_value)
-    return Path(raw) if t is Path else t(raw)
+def _json_loads(raw: bytes) -> Any:
+    """Decode JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    import json
+
+    return json.loads(raw)
+
+
+def _parse_run_file(path: str) -> Any:
+    """Read and decode one token run file (top-level so process pools can pickle it)."""
+    return _json_loads(Path(path).read_bytes())
 
 
 def _create_config(path: Path) -> None:
     """Create a user-friendly initial config with only fields users should fill out."""
+    from configparser import ConfigParser  # only needed on first run
+
     cp = ConfigParser()
 
     # App section - required fields users must configure
@@ -70,10 +205,27 @@ def _create_config(path: Path) -> None:
         cp.write(f)
 
 
+def _read_ini(path: Path) -> List[Tuple[str, str, str]]:
+    """Return `(section, key, value)` entries, using the fast reader when possible."""
+    data = path.read_bytes()
+    try:
+        return list(_fastini.parse(data))
+    except (ValueError, UnicodeDecodeError) as e:
+        logger.debug("Fast INI reader declined %s (%s); using ConfigParser", path, e)
+        from configparser import ConfigParser  # deferred: rarely needed
+
+        cp = ConfigParser()
+        cp.read_string(data.decode("utf-8"), source=str(path))
+        return [(sect, key, raw) for sect in cp.sections() for key, raw in cp.items(sect)]
+
+
 # Public API
 def load(path: Optional[Path] = None) -> Config:
-    """Load configuration from INI file and return Config object."""
-    cfg = Config()
+    """Load configuration from INI file and return Config object.
+
+    Parsed results are cached per path and reused until the file's mtime or
+    size changes; call `load.cache_clear()` to force a re-read.
+    """
     ini = path or INI_FILE
 
     # Create user-friendly template on first run with only fields users should fill out
@@ -95,28 +247,46 @@ def load(path: Optional[Path] = None) -> Config:
         logger.info("Exiting to allow user to configure credentials")
         sys.exit(0)
 
-    cp = ConfigParser()
-    cp.read(ini, encoding="utf-8")
+    st = ini.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CACHE.get(ini)
+    if cached is not None and cached[0] == stamp:
+        # Hand out a copy so callers can't mutate the cached instance
+        return copy.deepcopy(cached[1])
+
+    overrides: Dict[str, Dict[str, Any]] = {}
+    for sect, key, raw in _read_ini(ini):
+        if key in _FIELDS.get(sect, ()):
+            overrides.setdefault(sect, {})[key] = _cast(_CASTERS[sect, key], raw)
 
-    for sect in cp.sections():
-        if not hasattr(cfg, sect):
-            continue
-        dst = getattr(cfg, sect)
-        for key, raw in cp.items(sect):
-            if hasattr(dst, key):
-                setattr(dst, key, _cast(getattr(dst, key), raw))
-    return cfg
+    # Start from a shallow copy of the defaults prototype: sections without
+    # overrides are shared with it, which is safe because the cached Config is
+    # never handed out directly. Overridden sections are rebuilt via replace(),
+    # which also works for frozen sections (Token).
+    cfg = copy.copy(_DEFAULTS)
+    for sect, values in overrides.items():
+        setattr(cfg, sect, replace(getattr(_DEFAULTS, sect), **values))
+
+    _CACHE[ini] = (stamp, cfg)
+    return copy.deepcopy(cfg)
+
+
+load.cache_clear = _CACHE.clear
 
 
 class TokenManager:
     """
-    Manages Facebook API tokens with timestamped JSON storage.
+    Manages Facebook API tokens with append-only JSON storage.
 
-    Each run creates a new JSON file with format: tokens-YYYY-MM-DD-HHMMSS.json
-    This preserves the history of token operations and separates concerns between
-    static configuration and dynamic token artifacts.
+    Every save appends one line to `tokens.ndjson` (the run history) and rewrites
+    `tokens-latest.json`, so finding the latest tokens never scans the directory.
+    Per-run files from older versions (tokens-YYYY-MM-DD-HHMMSS.json) are still
+    read when no `tokens-latest.json` exists yet.
     """
 
+    LOG_NAME = "tokens.ndjson"
+    LATEST_NAME = "tokens-latest.json"
+
     def __init__(self, storage_dir: Path = Path("config", "facebook", "tokens")):
         """
         Initialize TokenManager with storage directory.
@@ -126,77 +296,114 @@ class TokenManager:
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(exist_ok=True)
-        self.current_run_timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S")
-        self.current_file = self.storage_dir / f"tokens-{self.current_run_timestamp}.json"
+        # One clock read for both the run ID and metadata. UTC keeps run IDs
+        # sorting chronologically across DST changes.
+        now = datetime.now(timezone.utc)
+        self.current_run_timestamp = now.strftime("%Y-%m-%dT%H%M%SZ")
+        self.current_file = self.storage_dir / self.LATEST_NAME
+        self.log_file = self.storage_dir / self.LOG_NAME
 
         # Initialize empty token data
         self.user_config = User()
-        self.page_configs: Dict[str, Page] = {}
+        self._clear_pages()
         self.run_metadata = {
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": now.isoformat(),
             "run_id": self.current_run_timestamp
         }
 
-    def _serialize_token_info(self, token_info: Optional[Token]) -> Optional[Dict]:
-        """Convert Token dataclass to dict for JSON serialization."""
-        if token_info is None:
-            return None
-        return asdict(token_info)
+        # (storage_dir mtime_ns, sorted run file names) from the last directory scan
+        self._run_files_cache: Optional[Tuple[int, List[str]]] = None
 
-    def _deserialize_token_info(self, data: Optional[Dict]) -> Optional[Token]:
-        """Convert dict back to Token dataclass."""
-        if data is None:
-            return None
-        return Token(**data)
-
-    def _serialize_user_config(self, user_config: User) -> Dict:
-        """Convert User dataclass to dict for JSON serialization."""
-        data = asdict(user_config)
-        # Handle nested Token
-        if data.get('long_lived_token'):
-            data['long_lived_token'] = self._serialize_token_info(user_config.long_lived_token)
-        return data
-
-    def _deserialize_user_config(self, data: Dict) -> User:
-        """Convert dict back to User dataclass."""
-        # Handle nested Token
-        if data.get('long_lived_token'):
-            data['long_lived_token'] = self._deserialize_token_info(data['long_lived_token'])
-        return User(**data)
-
-    def _serialize_page_config(self, page_config: Page) -> Dict:
-        """Convert Page dataclass to dict for JSON serialization."""
-        data = asdict(page_config)
-        # Handle nested Token
-        if data.get('page_access_token'):
-            data['page_access_token'] = self._serialize_token_info(page_config.page_access_token)
-        return data
-
-    def _deserialize_page_config(self, data: Dict) -> Page:
-        """Convert dict back to Page dataclass."""
-        # Handle nested Token
-        if data.get('page_access_token'):
-            data['page_access_token'] = self._deserialize_token_info(data['page_access_token'])
-        return Page(**data)
+    def _clear_pages(self) -> None:
+        """Reset the page columns.
+
+        Pages are stored column-wise (one list per Page field, row order =
+        insertion order) so summaries and serialization walk flat lists instead
+        of hopping through a Page object per row. `_page_index` maps the
+        page_configs key to its row.
+        """
+        self._page_index: Dict[str, int] = {}
+        self._page_keys: List[str] = []
+        self._page_ids: List[Optional[str]] = []
+        self._page_names: List[Optional[str]] = []
+        self._page_tokens: List[Optional[Token]] = []
+        self._page_categories: List[Optional[str]] = []
+
+    @property
+    def page_configs(self) -> Dict[str, Page]:
+        """Pages keyed by page ID, materialized from the columns (a fresh copy)."""
+        return {
+            key: Page(page_id=pid, page_name=name, page_access_token=token, category=category)
+            for key, pid, name, token, category in zip(
+                self._page_keys, self._page_ids, self._page_names,
+                self._page_tokens, self._page_categories)
+        }
+
+    @page_configs.setter
+    def page_configs(self, pages: Dict[str, Page]) -> None:
+        self._clear_pages()
+        for page_id, page_config in pages.items():
+            self.add_page_config(page_id, page_config)
+
+    def _run_file_names(self) -> List[str]:
+        """Return legacy per-run file names sorted oldest-first, rescanning only on change."""
+        mtime_ns = os.stat(self.storage_dir).st_mtime_ns
+        if self._run_files_cache is not None and self._run_files_cache[0] == mtime_ns:
+            return self._run_files_cache[1]
+
+        with os.scandir(self.storage_dir) as entries:
+            names = sorted(
+                entry.name for entry in entries
+                if entry.name.startswith("tokens-") and entry.name.endswith(".json")
+                and entry.name != self.LATEST_NAME
+            )
+        self._run_files_cache = (mtime_ns, names)
+        return names
+
+    # Schema-generated (de)serializers, see _build_codec
+    _serialize_token_info = staticmethod(_encode_token)
+    _deserialize_token_info = staticmethod(_decode_token)
+    _serialize_user_config = staticmethod(_encode_user)
+    _deserialize_user_config = staticmethod(_decode_user)
+    _serialize_page_config = staticmethod(_encode_page)
+    _deserialize_page_config = staticmethod(_decode_page)
 
     def save_run_data(self) -> str:
         """
-        Save current run data to timestamped JSON file.
+        Append current run data to the token log and refresh the latest snapshot.
 
         Returns:
-            Path to the saved file
+            Path to the latest-tokens file
         """
+        # User and Token objects go straight to the encoder (see _json_dumps),
+        # so there is no separate pass building intermediate dicts for them
         run_data = {
             "metadata": self.run_metadata,
-            "user_config": self._serialize_user_config(self.user_config),
+            "user_config": self.user_config,
             "page_configs": {
-                page_id: self._serialize_page_config(page_config)
-                for page_id, page_config in self.page_configs.items()
+                key: {
+                    'page_id': pid,
+                    'page_name': name,
+                    'page_access_token': token,
+                    'category': category,
+                }
+                for key, pid, name, token, category in zip(
+                    self._page_keys, self._page_ids, self._page_names,
+                    self._page_tokens, self._page_categories)
             }
         }
 
-        with open(self.current_file, 'w', encoding='utf-8') as f:
-            json.dump(run_data, f, indent=2, ensure_ascii=False)
+        # One compact line per run; O_APPEND keeps concurrent writers from interleaving
+        fd = os.open(self.log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        try:
+            os.write(fd, _json_dumps(run_data, indent=False) + b"\n")
+        finally:
+            os.close(fd)
+
+        # Replace the snapshot atomically so readers never see a partial file
+        tmp_file = self.current_file.with_name(f".{self.LATEST_NAME}.tmp")
+        tmp_file.write_bytes(_json_dumps(run_data))
+        os.replace(tmp_file, self.current_file)
 
         return str(self.current_file)
 
@@ -207,9 +414,10 @@ class TokenManager:
         Args:
             file_path: Path to the JSON file to load
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            run_data = json.load(f)
+        self._apply_run_data(_json_loads(Path(file_path).read_bytes()))
 
+    def _apply_run_data(self, run_data: Dict) -> None:
+        """Replace the in-memory state with a decoded run record."""
         self.run_metadata = run_data.get("metadata", {})
         self.user_config = self._deserialize_user_config(run_data.get("user_config", {}))
         self.page_configs = {
@@ -217,6 +425,40 @@ class TokenManager:
             for page_id, page_data in run_data.get("page_configs", {}).items()
         }
 
+    @staticmethod
+    def load_many(file_paths: List[str]) -> List[Dict]:
+        """
+        Decode many run files, e.g. the legacy archive from `list_run_files`.
+
+        Parsing is CPU-bound, so large batches are spread over a process pool;
+        small ones stay serial since spawning workers would cost more than it saves.
+
+        Args:
+            file_paths: Paths to token JSON files
+
+        Returns:
+            Raw run records, in the same order as `file_paths`
+        """
+        workers = os.cpu_count() or 1
+        if workers == 1 or len(file_paths) < workers * 2:
+            return [_parse_run_file(path) for path in file_paths]
+
+        chunksize = max(1, len(file_paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_parse_run_file, file_paths, chunksize=chunksize))
+
+    def load_run_history(self) -> List[Dict]:
+        """
+        Read every run recorded in the token log.
+
+        Returns:
+            Raw run records (metadata, user_config, page_configs), newest first
+        """
+        if not self.log_file.exists():
+            return []
+        lines = self.log_file.read_bytes().splitlines()
+        return [_json_loads(line) for line in reversed(lines) if line.strip()]
+
     def get_latest_run_file(self) -> Optional[str]:
         """
         Get the path to the most recent token file.
@@ -224,23 +466,25 @@ class TokenManager:
         Returns:
             Path to the latest token file, or None if no files exist
         """
-        token_files = list(self.storage_dir.glob("tokens-*.json"))
-        if not token_files:
-            return None
+        if self.current_file.exists():
+            return str(self.current_file)
 
-        # Sort by filename (which includes timestamp) and get the latest
-        latest_file = sorted(token_files, key=lambda f: f.name)[-1]
-        return str(latest_file)
+        # Fall back to legacy per-run files; their names embed the timestamp
+        names = self._run_file_names()
+        if not names:
+            return None
+        return str(self.storage_dir / names[-1])
 
     def list_run_files(self) -> List[str]:
         """
-        List all token run files, sorted by timestamp (newest first).
+        List legacy per-run token files, sorted by timestamp (newest first).
+
+        Runs saved by this version live in the token log; see `load_run_history`.
 
         Returns:
             List of file paths
         """
-        token_files = list(self.storage_dir.glob("tokens-*.json"))
-        return [str(f) for f in sorted(token_files, key=lambda f: f.name, reverse=True)]
+        return [str(self.storage_dir / name) for name in reversed(self._run_file_names())]
 
     def update_user_config(
         self,
@@ -261,11 +505,33 @@ class TokenManager:
 
     def add_page_config(self, page_id: str, page_config: Page) -> None:
         """Add or update a page configuration."""
-        self.page_configs[page_id] = page_config
+        # Interned keys let dict lookups short-circuit on identity
+        page_id = sys.intern(page_id)
+        row = self._page_index.get(page_id)
+        if row is None:
+            self._page_index[page_id] = len(self._page_keys)
+            self._page_keys.append(page_id)
+            self._page_ids.append(page_config.page_id)
+            self._page_names.append(page_config.page_name)
+            self._page_tokens.append(page_config.page_access_token)
+            self._page_categories.append(page_config.category)
+        else:
+            self._page_ids[row] = page_config.page_id
+            self._page_names[row] = page_config.page_name
+            self._page_tokens[row] = page_config.page_access_token
+            self._page_categories[row] = page_config.category
 
     def get_page_config(self, page_id: str) -> Optional[Page]:
         """Get a specific page configuration."""
-        return self.page_configs.get(page_id)
+        row = self._page_index.get(page_id)
+        if row is None:
+            return None
+        return Page(
+            page_id=self._page_ids[row],
+            page_name=self._page_names[row],
+            page_access_token=self._page_tokens[row],
+            category=self._page_categories[row],
+        )
 
     def get_summary(self) -> Dict:
         """Get a summary of the current token state."""
@@ -275,6 +541,6 @@ class TokenManager:
             "user_id": self.user_config.user_id,
             "user_name": self.user_config.user_name,
             "has_long_lived_token": self.user_config.long_lived_token is not None,
-            "page_count": len(self.page_configs),
-            "page_names": [config.page_name for config in self.page_configs.values() if config.page_name]
+            "page_count": len(self._page_keys),
+            "page_names": [name for name in self._page_names if name]
         }
@@ -5,7 +5,7 @@ import time
 from typing import Optional
 from dataclasses import dataclass, field
 
-@dataclass
+@dataclass(slots=True)
 class App:
     """Facebook App configuration - static user settings"""
     app_id: str = "YOUR_APP_ID_HERE"
@@ -18,7 +18,7 @@ class App:
         return f"https://graph.facebook.com/{self.api_version}"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Token:
     """Token information with expiration tracking"""
     access_token: str = ""
@@ -26,20 +26,23 @@ class Token:
     expires_in: Optional[int] = None  # Seconds from now
     token_type: str = ""
 
-    def is_expired(self) -> bool:
-        """Check if token is expired"""
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Check if token is expired.
+
+        Pass `now` (a `time.time()` value) to share one clock read across a batch.
+        """
         if self.expires_at is None:
             return False
-        return time.time() >= self.expires_at
+        return (time.time() if now is None else now) >= self.expires_at
 
-    def time_until_expiry(self) -> Optional[int]:
-        """Get seconds until token expires"""
+    def time_until_expiry(self, now: Optional[float] = None) -> Optional[int]:
+        """Get seconds until token expires (`now` as in `is_expired`)"""
         if self.expires_at is None:
             return None
-        return max(0, int(self.expires_at - time.time()))
+        return max(0, int(self.expires_at - (time.time() if now is None else now)))
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User configuration and token info"""
     user_id: Optional[str] = None
@@ -48,7 +51,7 @@ class User:
     long_lived_token: Optional[Token] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Page:
     """Page configuration and token info"""
     page_id: Optional[str] = None
@@ -57,7 +60,7 @@ class Page:
     category: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Main configuration container aggregating all sections."""
     app:     App    = field(default_factory=App)
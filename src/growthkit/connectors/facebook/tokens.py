@@ -6,7 +6,8 @@ This script exchanges short-lived user access tokens for long-lived tokens
 and retrieves page access tokens. It uses config.ini for configuration management
 and provides both CLI and interactive modes.
 
-By default, tokens are saved to timestamped JSON files in the tokens/ directory.
+By default, each run is appended to tokens/tokens.ndjson and mirrored to
+tokens/tokens-latest.json.
 Use --no-save to skip saving tokens.
 
 Usage:
@@ -14,15 +15,26 @@ Usage:
     python tokens.py --config <config_file> [--no-save]
 """
 
+import re
 import sys
 import json
 import time
+import threading
+import logging
 import argparse
 import urllib.parse
-import urllib.request
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterator, List, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the `speedups` extra
+    orjson = None
 
 from growthkit.utils.style import ansi
 from growthkit.utils.logs import report
@@ -33,47 +45,181 @@ from growthkit.connectors.facebook.schema import Token, Page
 logger = report.settings(__file__)
 config = engine.load(Path("config", "facebook", "facebook.ini"))
 
-
-def make_api_request(url: str) -> Dict[str, Any]:
-    """Make a request to Facebook Graph API"""
+# Page-token lookups are independent and I/O-bound; cap concurrency to stay
+# well inside Graph API rate limits
+PAGE_TOKEN_WORKERS = 20
+# Graph API accepts at most 50 sub-requests per batch call
+BATCH_LIMIT = 50
+# Safety limit on pages followed per paginated endpoint
+MAX_PAGES = 50
+REQUEST_TIMEOUT = 30  # seconds
+# Graph allows roughly 600 calls per 600s per token; stay under it, and drop
+# to the throttled rate once `x-app-usage` reports more than the threshold
+RATE_LIMIT_CALLS = 500
+RATE_LIMIT_THROTTLED_CALLS = 100
+RATE_LIMIT_PERIOD = 600  # seconds
+APP_USAGE_THRESHOLD = 80  # percent
+
+# Every call goes to graph.facebook.com, so one pooled session keeps TCP/TLS
+# connections alive across requests (and across the page-token worker threads)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50))
+
+# Batch sub-responses that can't change within a run, keyed by
+# (user token, relative URL). A page shared by several businesses has its
+# token looked up once. The process is short-lived, so entries never need
+# invalidating.
+_RESPONSE_CACHE: Dict[Tuple[str, str], Any] = {}
+_CACHEABLE_PATHS = ('me', 'me/permissions', 'me/businesses')
+
+# `access_token=...` query parameter, plus whatever separator follows it
+_ACCESS_TOKEN_RE = re.compile(r'([?&])access_token=[^&]*(&|$)')
+
+# Console lines printed per request / per page, with the colour codes baked in
+# once instead of being re-interpolated on every call
+_HTTP_ERROR_FMT = f"HTTP {ansi.red}Error{ansi.reset} {{}}: {{}}"
+_API_ERROR_FMT = f"API Error details: {ansi.red}{{}}{ansi.reset}"
+_UNPARSEABLE_FMT = f"{ansi.red}Could not parse error response: {{}}{ansi.reset}"
+_REQUEST_FAILED_FMT = f"Request {ansi.red}failed{ansi.reset}: {ansi.red}{{}}{ansi.reset}"
+_PAGINATION_START_FMT = f"\n{ansi.cyan}PAGINATION DEBUG: Starting data collection from {{}}{ansi.reset}"
+_PAGINATION_DONE_FMT = f"{ansi.cyan}PAGINATION COMPLETE: {{}} total items across {{}} pages{ansi.reset}"
+_PAGE_FAILED_FMT = f"  Page {{}}: {ansi.red}Request failed: {{}}{ansi.reset}"
+_PAGE_LIMIT_MSG = (f"  {ansi.yellow}WARNING: Reached safety limit of {MAX_PAGES} pages. "
+                   f"Stopping pagination.{ansi.reset}")
+_TOKEN_FAILED_FMT = (f"  {ansi.red}✗ {{}} - Token failed "
+                     f"(needs pages_read_engagement permission){ansi.reset}")
+_TOKEN_OK_FMT = f"  {ansi.green}✓ {{}} - TOKEN RETRIEVED{ansi.reset}"
+
+# Response decoder; both raise a json.JSONDecodeError subclass on bad input
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _is_cacheable(relative_url: str) -> bool:
+    """True for sub-requests whose answer can't change within a run (user identity, grants, page tokens)"""
+    parts = urllib.parse.urlsplit(relative_url)
+    return parts.path.strip('/') in _CACHEABLE_PATHS or 'fields=access_token' in parts.query
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket: at most `max_calls` per `period` seconds.
+
+    `acquire()` blocks until a call may go out. The rate can be changed while
+    running, which is how Graph's usage headers slow us down.
+    """
+
+    def __init__(self, max_calls: int, period: float):
+        self.period = period
+        self.max_calls = max_calls
+        self._tokens = float(max_calls)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def set_max_calls(self, max_calls: int) -> None:
+        """Change the allowed calls per period, keeping no more than the new burst"""
+        with self._lock:
+            self._refill()
+            self.max_calls = max_calls
+            self._tokens = min(self._tokens, float(max_calls))
+
+    def acquire(self, permits: int = 1) -> None:
+        """
+        Take `permits` call permits, sleeping until they are available.
+
+        Requests larger than the current burst are taken in burst-sized slices,
+        so they are paced at the rate instead of waiting forever.
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                take = min(permits, self.max_calls)
+                if self._tokens >= take:
+                    self._tokens -= take
+                    permits -= take
+                    if permits <= 0:
+                        return
+                    continue
+                wait = (take - self._tokens) * self.period / self.max_calls
+            time.sleep(wait)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        rate = self.max_calls / self.period
+        self._tokens = min(float(self.max_calls), self._tokens + (now - self._stamp) * rate)
+        self._stamp = now
+
+
+# Shared by every thread that talks to the Graph API
+_LIMITER = RateLimiter(RATE_LIMIT_CALLS, RATE_LIMIT_PERIOD)
+
+
+def _observe_app_usage(response: requests.Response) -> None:
+    """Adapt the limiter to the `x-app-usage` header (percentages of the app's quota)"""
+    header = response.headers.get('x-app-usage')
+    if not header:
+        return
+    try:
+        usage = _json_loads(header)
+        peak = max(usage.get('call_count', 0), usage.get('total_cputime', 0),
+                   usage.get('total_time', 0))
+    except (json.JSONDecodeError, AttributeError, TypeError):
+        logger.debug("Ignoring malformed x-app-usage header: %s", header)
+        return
+
+    target = RATE_LIMIT_THROTTLED_CALLS if peak > APP_USAGE_THRESHOLD else RATE_LIMIT_CALLS
+    if target != _LIMITER.max_calls:
+        logger.warning("App usage at %s%%, rate limit now %d calls / %ds",
+                       peak, target, RATE_LIMIT_PERIOD)
+        _LIMITER.set_max_calls(target)
+
+
+def make_api_request(url: str, data: Optional[Dict[str, str]] = None, permits: int = 1) -> Any:
+    """
+    Make a request to Facebook Graph API (form-encoded POST when `data` is given).
+
+    `permits` is how many calls Graph counts this request as; a batch POST
+    counts once per sub-request.
+    """
     logger.info("Making API request to: %s", url)
-    print(f"Making API request to: {ansi.cyan}{url[:100]}"
-          f"{'...' if len(url) > 100 else ''}{ansi.reset}")
+    _LIMITER.acquire(permits)
 
     try:
-        with urllib.request.urlopen(url) as response:
-            logger.info("API request successful, status: %s", response.status)
-            print(f"API request {ansi.green}successful{ansi.reset}, "
-                  f"status: {ansi.green}{response.status}{ansi.reset}")
-
-            response_text = response.read().decode()
-            logger.debug("Raw API response: %s", response_text)
-            print(f"Raw API response: {ansi.grey}{response_text[:200]}"
-                  f"{'...' if len(response_text) > 200 else ''}{ansi.reset}")
-
-            data = json.loads(response_text)
-            logger.info("API response parsed successfully")
-            return data
+        if data is None:
+            response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
+        else:
+            response = _SESSION.post(url, data=data, timeout=REQUEST_TIMEOUT)
+        _observe_app_usage(response)
+        response.raise_for_status()
 
-    except urllib.error.HTTPError as e:
-        logger.error("HTTP Error %s: %s", e.code, e.reason)
-        print(f"HTTP {ansi.red}Error{ansi.reset} {e.code}: {e.reason}")
+    except requests.HTTPError as e:
+        status, reason = e.response.status_code, e.response.reason
+        logger.error("HTTP Error %s: %s", status, reason)
+        print(_HTTP_ERROR_FMT.format(status, reason))
 
         try:
-            error_text = e.read().decode()
-            error_data = json.loads(error_text)
+            error_data = e.response.json()
             logger.error("API Error details: %s", error_data)
-            print(f"API Error details: {ansi.red}{error_data}{ansi.reset}")
+            print(_API_ERROR_FMT.format(error_data))
         except json.JSONDecodeError as parse_error:
             logger.error("Could not parse error response: %s", parse_error)
-            print(f"{ansi.red}Could not parse error response: {parse_error}{ansi.reset}")
+            print(_UNPARSEABLE_FMT.format(parse_error))
         raise
 
-    except (urllib.error.URLError, OSError) as e:
+    except requests.RequestException as e:
         logger.error("Request failed with exception: %s", str(e))
-        print(f"Request {ansi.red}failed{ansi.reset}: {ansi.red}{str(e)}{ansi.reset}")
+        print(_REQUEST_FAILED_FMT.format(e))
         raise
 
+    logger.info("API request successful, status: %s", response.status_code)
+    # Only materialize the body as text when someone will actually read it
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Raw API response: %s", response.text)
+
+    # Decode straight from the body bytes; no intermediate str
+    result = _json_loads(response.content)
+    logger.info("API response parsed successfully")
+    return result
+
 
 def get_long_lived_user_token(short_lived_token: str) -> Token:
     """Exchange short-lived user token for long-lived token"""
@@ -120,7 +266,7 @@ def get_long_lived_user_token(short_lived_token: str) -> Token:
 
     expires_at = None
     if 'expires_in' in data:
-        expires_at = int(time.time() + data['expires_in'])
+        expires_at = int(time.time()) + int(data['expires_in'])
 
     return Token(
         access_token=data['access_token'],
@@ -130,103 +276,159 @@ def get_long_lived_user_token(short_lived_token: str) -> Token:
     )
 
 
-def get_all_paginated_data(url: str, user_token: str) -> list:
-    """Get all data from a paginated Facebook API endpoint"""
-    all_data = []
-    current_url = url
-    page_count = 0
+def _with_token(url: str, user_token: str) -> str:
+    """Append the access token to a Graph API URL"""
+    separator = '&' if '?' in url else '?'
+    return f"{url}{separator}access_token={user_token}"
 
-    print(f"\n{ansi.cyan}PAGINATION DEBUG: Starting data collection from {url}{ansi.reset}")
 
-    while current_url:
-        page_count += 1
-        try:
-            # Make the request
-            if '?' in current_url:
-                current_url += f"&access_token={user_token}"
-            else:
-                current_url += f"?access_token={user_token}"
+def _strip_token(next_url: str) -> str:
+    """Remove access_token from a `paging.next` URL so it can be re-added"""
+    if 'access_token=' not in next_url:
+        return next_url
+    # Keep the separator only when another parameter follows the token
+    stripped = _ACCESS_TOKEN_RE.sub(lambda m: m.group(1) if m.group(2) else '', next_url)
+    return stripped.rstrip('?&')
 
-            print(f"  Page {page_count}: Requesting {len(all_data)} items so far...")
-            response_data = make_api_request(current_url)
 
-            # Add this batch of data
+def iter_paginated(url: str, user_token: str,
+                   first_page: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield items from a paginated Facebook API endpoint.
+
+    As soon as a page arrives, the request for the next page is submitted to a
+    background worker, so the network wait overlaps with whatever the caller
+    does with the current page's items. Pass `first_page` when the first
+    response was already fetched (e.g. through a batch request). One start
+    and one completion summary line are printed per call.
+    """
+    print(_PAGINATION_START_FMT.format(url))
+    item_count = 0
+    page_count = 0
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        if first_page is None:
+            future = executor.submit(make_api_request, _with_token(url, user_token))
+        else:
+            future = Future()
+            future.set_result(first_page)
+
+        while future is not None:
+            page_count += 1
+            try:
+                response_data = future.result()
+            except (requests.RequestException, json.JSONDecodeError) as e:
+                logger.error("Pagination request failed: %s", str(e))
+                print(_PAGE_FAILED_FMT.format(page_count, e))
+                break
+
             data_batch = response_data.get('data', [])
-            all_data.extend(data_batch)
-
-            print(f"  Page {page_count}: Got {len(data_batch)} items (total: {len(all_data)})")
-
-            # Check for next page
-            paging = response_data.get('paging', {})
-            next_url = paging.get('next')
-
-            if next_url:
-                print(f"  Page {page_count}: Next page available")
-                # Remove access_token from next URL since we'll add it again
-                if 'access_token=' in next_url:
-                    # Parse the URL and rebuild without access_token
-                    parsed = urllib.parse.urlparse(next_url)
-                    query_params = dict(urllib.parse.parse_qsl(parsed.query))
-                    query_params.pop('access_token', None)
-                    query_string = urllib.parse.urlencode(query_params)
-                    base_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-                    current_url = f"{base_url}?{query_string}" if query_string else base_url
-                else:
-                    current_url = next_url
+            item_count += len(data_batch)
+            logger.debug("Page %d: got %d items (total: %d)",
+                         page_count, len(data_batch), item_count)
+
+            # Kick off the next page before handing this one to the caller
+            future = None
+            next_url = response_data.get('paging', {}).get('next')
+            if not next_url:
+                logger.debug("Page %d: no more pages available", page_count)
+            elif page_count > MAX_PAGES:
+                # Safety check to prevent infinite loops
+                print(_PAGE_LIMIT_MSG)
             else:
-                print(f"  Page {page_count}: No more pages available")
-                current_url = None
+                future = executor.submit(make_api_request,
+                                         _with_token(_strip_token(next_url), user_token))
 
-            # Safety check to prevent infinite loops
-            if page_count > 50:  # Reasonable safety limit
-                warning_msg = "WARNING: Reached safety limit of 50 pages. Stopping pagination."
-                print(f"  {ansi.yellow}{warning_msg}{ansi.reset}")
-                break
+            yield from data_batch
 
-        except (urllib.error.HTTPError, urllib.error.URLError, OSError, json.JSONDecodeError) as e:
-            logger.error("Pagination request failed: %s", str(e))
-            print(f"  Page {page_count}: {ansi.red}Request failed: {str(e)}{ansi.reset}")
-            break
+    print(_PAGINATION_DONE_FMT.format(item_count, page_count))
 
-    pagination_msg = f"PAGINATION COMPLETE: {len(all_data)} total items across {page_count} pages"
-    print(f"{ansi.cyan}{pagination_msg}{ansi.reset}")
-    return all_data
 
+def make_batch_request(relative_urls: List[str], user_token: str) -> List[Optional[Any]]:
+    """
+    Run GET sub-requests through the Graph API batch endpoint.
 
-def get_business_manager_pages(user_token: str) -> tuple[Dict[str, Page], list]:
-    """Get pages accessible through Business Manager"""
-    print(f"\n{ansi.cyan}DEBUG: Checking Business Manager accounts...{ansi.reset}")
+    Each call carries up to BATCH_LIMIT sub-requests. Returns one decoded body
+    per relative URL, in order, or None where that sub-request failed.
+    Cacheable sub-requests answered earlier in the run are not sent again.
+    """
+    results: List[Optional[Any]] = [None] * len(relative_urls)
+    pending: List[int] = []
+    for i, url in enumerate(relative_urls):
+        cached = _RESPONSE_CACHE.get((user_token, url))
+        if cached is None:
+            pending.append(i)
+        else:
+            results[i] = cached
+    if len(pending) < len(relative_urls):
+        logger.info("Using %d cached batch sub-response(s)", len(relative_urls) - len(pending))
+
+    for start in range(0, len(pending), BATCH_LIMIT):
+        chunk = pending[start:start + BATCH_LIMIT]
+        batch = json.dumps([{"method": "GET", "relative_url": relative_urls[i]} for i in chunk])
+        responses = make_api_request(config.app.base_url, data={
+            'access_token': user_token,
+            'batch': batch,
+            'include_headers': 'false',
+        }, permits=len(chunk))
+        for i, item in zip(chunk, responses):
+            if not item or item.get('code') != 200:
+                continue
+            try:
+                body = _json_loads(item['body'])
+            except (KeyError, TypeError, json.JSONDecodeError):
+                continue
+            results[i] = body
+            if _is_cacheable(relative_urls[i]):
+                _RESPONSE_CACHE[(user_token, relative_urls[i])] = body
+    return results
+
+
+def _fetch_page_tokens(page_ids: List[str], user_token: str) -> List[Optional[Dict[str, Any]]]:
+    """Request access tokens for many pages; None marks a page whose lookup failed"""
+    chunks = [page_ids[i:i + BATCH_LIMIT] for i in range(0, len(page_ids), BATCH_LIMIT)]
+
+    def fetch_chunk(chunk: List[str]) -> List[Optional[Dict[str, Any]]]:
+        try:
+            return make_batch_request([f"{pid}?fields=access_token" for pid in chunk],
+                                      user_token)
+        except (requests.RequestException, json.JSONDecodeError):
+            return [None] * len(chunk)
 
-    # Get Business Manager accounts the user has access to (with pagination)
-    businesses_url = f"{config.app.base_url}/me/businesses"
-    businesses = get_all_paginated_data(businesses_url, user_token)
+    # Batches are independent, so large businesses send them concurrently
+    with ThreadPoolExecutor(max_workers=PAGE_TOKEN_WORKERS) as executor:
+        return [result for batch in executor.map(fetch_chunk, chunks) for result in batch]
 
-    print(f"Found {len(businesses)} Business Manager account(s):")
-    for i, business in enumerate(businesses, 1):
-        business_id = business['id']
-        business_name = business.get('name', 'Unknown')
-        name_id_display = f"{business_name} (ID: {business_id})"
-        print(f"  {i}. {ansi.yellow}{name_id_display}{ansi.reset}")
 
-    if not businesses:
-        print("No Business Manager accounts found.")
-        return {}, []
+def get_business_manager_pages(
+        user_token: str,
+        businesses_page: Optional[Dict[str, Any]] = None
+) -> tuple[Dict[str, Page], list]:
+    """Get pages accessible through Business Manager, starting from `businesses_page` if given"""
+    print(f"\n{ansi.cyan}DEBUG: Checking Business Manager accounts...{ansi.reset}")
 
     # Get pages from each Business Manager
     all_business_pages = {}
     business_info = []
     target_pages_found = []
 
-    for business in businesses:
+    # Businesses are handled as they stream in, so the first business's pages
+    # are being fetched while later /me/businesses pages are still in flight
+    businesses_url = f"{config.app.base_url}/me/businesses"
+    business_count = 0
+    for business in iter_paginated(businesses_url, user_token, businesses_page):
+        business_count += 1
         business_id = business['id']
         business_name = business.get('name', 'Unknown')
+        name_id_display = f"{business_name} (ID: {business_id})"
+        print(f"\n{business_count}. {ansi.yellow}{name_id_display}{ansi.reset}")
+        print(f"{ansi.cyan}Getting pages from Business Manager: {business_name}{ansi.reset}")
 
-        print(f"\n{ansi.cyan}Getting pages from Business Manager: {business_name}{ansi.reset}")
-
-        # Get pages owned by this business (with pagination)
+        # Get pages owned by this business (with pagination); the token batches
+        # below need the full id list, so this one is materialized
         business_pages_url = f"{config.app.base_url}/{business_id}/owned_pages"
         try:
-            pages = get_all_paginated_data(business_pages_url, user_token)
+            pages = list(iter_paginated(business_pages_url, user_token))
 
             # Count pages and look for target pages first
             target_pages_in_business = []
@@ -234,6 +436,7 @@ def get_business_manager_pages(user_token: str) -> tuple[Dict[str, Page], list]:
                 page_name = page.get('name', 'Unknown')
                 if False:  # remove client-specific targeting
                     target_pages_in_business.append((page['id'], page_name))
+            target_ids = {target_id for target_id, _ in target_pages_in_business}
 
             print(f"Found {len(pages)} page(s) in {business_name}")
             if target_pages_in_business:
@@ -247,46 +450,37 @@ def get_business_manager_pages(user_token: str) -> tuple[Dict[str, Page], list]:
             successful_tokens = 0
             failed_tokens = 0
 
-            for page in pages:
+            # Fetch page tokens via batched requests; results come back in page order
+            token_responses = _fetch_page_tokens([page['id'] for page in pages], user_token)
+
+            for page, page_token_data in zip(pages, token_responses):
                 page_id = page['id']
                 page_name = page.get('name', 'Unknown')
                 category = page.get('category', 'Unknown')
 
-                # Try to get page access token quietly
-                page_token_url = (
-                    f"{config.app.base_url}/{page_id}"
-                    f"?fields=access_token&access_token={user_token}"
-                )
-                try:
-                    page_token_data = make_api_request(page_token_url)
-                    if 'access_token' in page_token_data:
-                        page_config = Page(
-                            page_id=page_id,
-                            page_name=page_name,
-                            category=category,
-                            page_access_token=Token(
-                                access_token=page_token_data['access_token'],
-                                expires_at=None
-                            )
-                        )
-                        all_business_pages[page_id] = page_config
-                        successful_tokens += 1
-
-                        # Only show details for target pages
-                        if any(target_id == page_id for target_id, _ in target_pages_in_business):
-                            print(f"  {ansi.green}✓ {page_name} - TOKEN RETRIEVED{ansi.reset}")
-                    else:
-                        failed_tokens += 1
-                except (urllib.error.HTTPError, urllib.error.URLError, OSError,
-                        json.JSONDecodeError, KeyError):
+                if page_token_data is None:
                     failed_tokens += 1
                     # Only show failures for target pages
-                    is_target_page = any(target_id == page_id 
-                                       for target_id, _ in target_pages_in_business)
-                    if is_target_page:
-                        error_msg = ("✗ {page_name} - Token failed "
-                                   "(needs pages_read_engagement permission)").format(page_name=page_name)
-                        print(f"  {ansi.red}{error_msg}{ansi.reset}")
+                    if page_id in target_ids:
+                        print(_TOKEN_FAILED_FMT.format(page_name))
+                elif 'access_token' in page_token_data:
+                    page_config = Page(
+                        page_id=page_id,
+                        page_name=page_name,
+                        category=category,
+                        page_access_token=Token(
+                            access_token=page_token_data['access_token'],
+                            expires_at=None
+                        )
+                    )
+                    all_business_pages[page_id] = page_config
+                    successful_tokens += 1
+
+                    # Only show details for target pages
+                    if page_id in target_ids:
+                        print(_TOKEN_OK_FMT.format(page_name))
+                else:
+                    failed_tokens += 1
 
             # Show summary
             success_msg = f"{successful_tokens} successful"
@@ -302,9 +496,14 @@ def get_business_manager_pages(user_token: str) -> tuple[Dict[str, Page], list]:
                 'failed_tokens': failed_tokens
             })
 
-        except (urllib.error.HTTPError, urllib.error.URLError, OSError, json.JSONDecodeError) as e:
+        except (requests.RequestException, json.JSONDecodeError) as e:
             print(f"Failed to get pages from {business_name}: {ansi.red}{str(e)}{ansi.reset}")
 
+    if not business_count:
+        print("No Business Manager accounts found.")
+        return {}, []
+    print(f"\nFound {business_count} Business Manager account(s)")
+
     # Show target pages summary
     if target_pages_found:
         print(f"\n{ansi.magenta}🎯 TARGET PAGES SUMMARY:{ansi.reset}")
@@ -318,6 +517,30 @@ def get_business_manager_pages(user_token: str) -> tuple[Dict[str, Page], list]:
     return all_business_pages, business_info
 
 
+def _add_personal_page(pages: Dict[str, Page], page_data: Dict[str, Any],
+                       target_page_id: Optional[str]) -> None:
+    """Store one /accounts item in `pages`, honouring the optional target page"""
+    page_id = page_data['id']
+    page_name = page_data.get('name')
+
+    # If target_page_id is specified, only process that page
+    if target_page_id and page_id != target_page_id:
+        logger.info("Skipping personal page: %s (%s) - not target page",
+                   page_name, page_id)
+        return
+
+    logger.info("Processing personal page: %s (%s)", page_name, page_id)
+    pages[page_id] = Page(
+        page_id=page_id,
+        page_name=page_name,
+        category=page_data.get('category'),
+        page_access_token=Token(
+            access_token=page_data['access_token'],
+            expires_at=None
+        )
+    )
+
+
 def get_page_access_tokens(
         user_token: str,
         target_page_id: Optional[str] = None
@@ -330,9 +553,13 @@ def get_page_access_tokens(
     logger.info("Getting user ID via /me endpoint")
     print(f"Getting {ansi.cyan}user ID{ansi.reset} via /me endpoint...")
 
-    user_url = f"{config.app.base_url}/me?access_token={user_token}"
+    # /me, /me/permissions and the first /me/businesses page are independent,
+    # so they share one batch round trip
     try:
-        user_data = make_api_request(user_url)
+        user_data, permissions_data, businesses_page = make_batch_request(
+            ['me', 'me/permissions', 'me/businesses'], user_token)
+        if user_data is None:
+            raise requests.HTTPError("/me sub-request failed in batch response")
         user_id = user_data['id']
         user_name = user_data.get('name', 'Unknown')
         logger.info("User info retrieved - ID: %s, Name: %s", user_id, user_name)
@@ -356,18 +583,15 @@ def get_page_access_tokens(
 
     # Check token permissions/scope
     print(f"\n{ansi.cyan}DEBUG: Checking token permissions...{ansi.reset}")
-    permissions_url = f"{config.app.base_url}/me/permissions?access_token={user_token}"
-    try:
-        permissions_data = make_api_request(permissions_url)
+    if permissions_data is not None:
         print("Token permissions:")
         for perm in permissions_data.get('data', []):
             status = perm.get('status', 'unknown')
             permission = perm.get('permission', 'unknown')
             color = ansi.green if status == 'granted' else ansi.red
             print(f"  - {permission}: {color}{status}{ansi.reset}")
-
-    except (urllib.error.HTTPError, urllib.error.URLError, OSError, json.JSONDecodeError) as e:
-        print(f"Could not retrieve permissions: {ansi.red}{str(e)}{ansi.reset}")
+    else:
+        print(f"Could not retrieve permissions: {ansi.red}sub-request failed{ansi.reset}")
 
     # Get page access tokens from personal account (with pagination)
     pages_url = f"{config.app.base_url}/{user_id}/accounts"
@@ -376,52 +600,24 @@ def get_page_access_tokens(
     print(f"\nRequesting {ansi.magenta}personal page access tokens{ansi.reset} for "
           f"user: {ansi.yellow}{user_id}{ansi.reset}")
 
-    # Get ALL personal pages with pagination
-    personal_pages_data = get_all_paginated_data(pages_url, user_token)
-
-    # Debug: Show summary instead of all pages
-    print(f"Total personal pages found: {len(personal_pages_data)}")
-
-    # Look for target pages in personal pages
-    personal_target_pages = []
-    for page_data in personal_pages_data:
-        page_name = page_data.get('name', 'Unknown')
-        # no client-specific targeting retained
-
-    if personal_target_pages:
-        print(f"{ansi.magenta}🎯 TARGET PAGES FOUND IN PERSONAL PAGES:{ansi.reset}")
-        for page_id, page_name in personal_target_pages:
-            personal_page_display = f"→ {page_name} (ID: {page_id})"
-            print(f"  {ansi.magenta}{personal_page_display}{ansi.reset}")
-
     pages = {}
-    logger.info("Processing %d pages from personal API response", len(personal_pages_data))
+    personal_count = 0
 
-    # Process personal pages
-    for page_data in personal_pages_data:
-        page_id = page_data['id']
-        page_name = page_data.get('name')
+    # Personal pages and Business Manager pages are independent, so fetch them
+    # side by side; total wait is max(personal, business) rather than the sum
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        business_future = executor.submit(get_business_manager_pages, user_token,
+                                          businesses_page)
 
-        # If target_page_id is specified, only process that page
-        if target_page_id and page_id != target_page_id:
-            logger.info("Skipping personal page: %s (%s) - not target page",
-                       page_name, page_id)
-            continue
+        # Process personal pages as each API page arrives
+        for page_data in iter_paginated(pages_url, user_token):
+            personal_count += 1
+            _add_personal_page(pages, page_data, target_page_id)
 
-        logger.info("Processing personal page: %s (%s)", page_name, page_id)
-        page_config = Page(
-            page_id=page_id,
-            page_name=page_name,
-            category=page_data.get('category'),
-            page_access_token=Token(
-                access_token=page_data['access_token'],
-                expires_at=None
-            )
-        )
-        pages[page_id] = page_config
+        business_pages, business_info = business_future.result()
 
-    # Also check Business Manager pages
-    business_pages, business_info = get_business_manager_pages(user_token)
+    print(f"Total personal pages found: {personal_count}")
+    logger.info("Processed %d pages from personal API response", personal_count)
 
     # Merge business pages with personal pages
     for page_id, business_page in business_pages.items():
@@ -432,7 +628,6 @@ def get_page_access_tokens(
         pages[page_id] = business_page
 
     # Summary
-    personal_count = len(personal_pages_data)
     total_count = len(pages)
 
     # Calculate Business Manager token stats
@@ -472,20 +667,20 @@ def convert_expiration_time(expires_in: Optional[int]) -> Optional[datetime]:
     if expires_in is None:
         return None
 
-    expiry_timestamp = time.time() + expires_in
-    return datetime.fromtimestamp(expiry_timestamp, tz=timezone.utc).astimezone()
+    # astimezone() per value picks the local offset in effect at that date (DST)
+    return datetime.fromtimestamp(int(time.time()) + expires_in, tz=timezone.utc).astimezone()
 
 
-def display_expiration_info(token_info: Token, token_name: str) -> None:
+def display_expiration_info(token_info: Token, token_name: str,
+                            now: Optional[float] = None) -> None:
     """Display token expiration information"""
     logger.info("Displaying token info for: %s", token_name)
     print(f"\n{ansi.cyan}{token_name}{ansi.reset} Token Information:")
     print(f"  Token: {ansi.yellow}{token_info.access_token[:20]}...{ansi.reset}")
 
     if token_info.expires_at:
-        local_time = datetime.fromtimestamp(token_info.expires_at,
-                                           tz=timezone.utc).astimezone()
-        time_until = token_info.time_until_expiry()
+        local_time = datetime.fromtimestamp(token_info.expires_at, tz=timezone.utc).astimezone()
+        time_until = token_info.time_until_expiry(now)
 
         logger.info("Token expires at: %s", local_time.isoformat())
         print(f"  Expires: {ansi.yellow}{local_time.strftime('%Y-%m-%d %H:%M:%S %Z')}"
@@ -586,10 +781,11 @@ def process_page_tokens(long_lived_user_token: Token, fb_page_id: Optional[str],
 
     # Display page information and update TokenManager
     print(f"\n{ansi.magenta}Processing {len(pages)} page(s):{ansi.reset}")
+    now = time.time()  # one clock read for the whole batch
     for page_id, page_cfg in pages.items():
         print(f"\nPage: {page_cfg.page_name} ({page_id})")
         print(f"  Category: {page_cfg.category}")
-        display_expiration_info(page_cfg.page_access_token, "Page Access")
+        display_expiration_info(page_cfg.page_access_token, "Page Access", now)
 
         # Add page to TokenManager
         token_manager.add_page_config(page_id, page_cfg)
@@ -620,7 +816,7 @@ def save_and_display_results(token_manager: TokenManager) -> None:
     logger.info("Token generation completed successfully")
     print(f"\n✅ Token generation {ansi.green}completed successfully{ansi.reset}!")
 
-    print("💡 Your tokens are now saved as timestamped JSON files.")
+    print("💡 Your tokens are saved to the token log (history) and tokens-latest.json.")
     print("📅 Tip: Add token expiration dates to your calendar for tracking.")
 
 
@@ -645,12 +841,12 @@ def main():
         # Step 3: Save tokens and display results
         save_and_display_results(token_manager)
 
-    except urllib.error.HTTPError as e:
+    except requests.HTTPError as e:
         logger.error("HTTP error during token generation: %s", str(e))
         print(f"\n❌ HTTP {ansi.red}Error{ansi.reset}: {e}")
         sys.exit(1)
 
-    except (urllib.error.URLError, OSError) as e:
+    except (requests.RequestException, OSError) as e:
         logger.error("Unexpected error during token generation: %s", str(e))
         print(f"\n❌ Unexpected {ansi.red}Error{ansi.reset}: {e}")
         print("Check the log file for detailed error information.")
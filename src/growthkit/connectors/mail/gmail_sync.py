@@ -3,19 +3,30 @@ This script is used to archive all messages from a Gmail account.
 """
 
 import re
+import os
 import sys
 import time
 import email
-import pickle
+import json
+import queue
 import base64
+import logging
+import functools
+import threading
 from io import BytesIO
 from pathlib import Path
-from urllib.parse import urlsplit
+from itertools import islice
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from email.header import decode_header
 from email.utils import parsedate_to_datetime
 
+import httplib2
 import google.auth.transport.requests
 from google.auth.exceptions import RefreshError
+from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -28,21 +39,68 @@ from growthkit.utils.style import ansi
 logger = report.settings(__file__)
 
 SCOPES = ["https://www.googleapis.com/auth/gmail.readonly"]
+# Messages fetched per batch HTTP call. The API accepts up to 100, but Gmail
+# recommends staying at 50 or below to avoid per-batch rate limiting.
+BATCH_SIZE = 50
+# Batches in flight at once. Each worker thread gets its own Gmail client
+# because the underlying httplib2 connection is not thread-safe.
+FETCH_WORKERS = 8
+# Gmail allows 250 quota units per user per second; messages.get costs 5
+QUOTA_UNITS_PER_SECOND = 250
+MESSAGE_GET_UNITS = 5
+# Messages whose fetch failed transiently (429/5xx under concurrent load) get a
+# second, sequential pass in small batches, backing off between attempts
+RETRY_BATCH_SIZE = 10
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 2.0  # seconds before the first retry, doubled each attempt
+# Statuses that will not change on retry (bad request, message since deleted)
+PERMANENT_ERROR_STATUSES = (400, 404)
+# Partial response for messages.get: headers and MIME tree, whose text parts
+# carry their body inline while attachments only carry an attachmentId
+MESSAGE_FIELDS = "payload,internalDate"
+HTTP_TIMEOUT = 60  # seconds, per socket operation
+# messages.list page size; the API default is 100 and the maximum 500
+MAX_LIST_RESULTS = 500
+# One progress line in the log per this many archived messages
+PROGRESS_LOG_EVERY = 100
+
+# Cleaning patterns, compiled once and reused for every message
+_RE_UTF8_ARTIFACT = re.compile(r'utf-8[a-zA-Z0-9]*')
+_RE_SPACES = re.compile(r' {3,}')
+_RE_NEWLINES = re.compile(r'\n{4,}')
+# Whitespace other than the newline itself at either end of a line
+_RE_LINE_EDGES = re.compile(r'^[^\S\n]+|[^\S\n]+$', re.MULTILINE)
+# http(s) link longer than 50 characters; group 1 is the domain (netloc)
+_RE_LONG_URL = re.compile(r'(?=\S{51})https?://([^/?#\s]*)\S*')
+
+# Invisible/zero-width characters commonly used for tracking, mapped to None
+_INVISIBLE_CHARS = ''.join([
+    '\u200B',  # Zero-width space
+    '\u200C',  # Zero-width non-joiner
+    '\u200D',  # Zero-width joiner
+    '\u2060',  # Word joiner
+    '\uFEFF',  # Zero-width non-breaking space
+    '\u034F',  # Combining grapheme joiner (common in email tracking)
+])
+_INVISIBLE_TABLE = str.maketrans('', '', _INVISIBLE_CHARS)
+
+# Anything clean_email_content would change besides the outer strip():
+# invisible chars, space runs, blank-line runs, whitespace at a line edge,
+# or a link long enough to shorten
+_RE_NEEDS_CLEANING = re.compile(
+    rf'[{_INVISIBLE_CHARS}]| {{3}}|\n{{4}}|[^\S\n]\n|\n[^\S\n]|(?=\S{{51}})https?://'
+)
 
 def clean_subject(subject):
     """Clean and decode email subject lines."""
-    # Decode any encoded subject lines
-    decoded_parts = decode_header(subject)
-    decoded_subject = ""
-    for part, encoding in decoded_parts:
-        if isinstance(part, bytes):
-            decoded_subject += part.decode(encoding or 'utf-8', errors='ignore')
-        else:
-            decoded_subject += part
+    # Decode any encoded subject lines, joining the parts once at the end
+    decoded_parts = [
+        part.decode(encoding or 'utf-8', errors='ignore') if isinstance(part, bytes) else part
+        for part, encoding in decode_header(subject)
+    ]
 
     # Remove any remaining odd encoding artifacts
-    decoded_subject = re.sub(r'utf-8[a-zA-Z0-9]*', '', decoded_subject)
-    return decoded_subject.strip()
+    return _RE_UTF8_ARTIFACT.sub('', ''.join(decoded_parts)).strip()
 
 def clean_email_content(content):
     """
@@ -51,55 +109,33 @@ def clean_email_content(content):
     if not content:
         return content
 
-    # Remove invisible/zero-width characters commonly used for tracking
-    # These include zero-width space, zero-width non-joiner, zero-width joiner, etc.
-    invisible_chars = [
-        '\u200B',  # Zero-width space
-        '\u200C',  # Zero-width non-joiner  
-        '\u200D',  # Zero-width joiner
-        '\u2060',  # Word joiner
-        '\uFEFF',  # Zero-width non-breaking space
-        '͏',       # Combining grapheme joiner (common in email tracking)
-        '‌',       # Zero-width non-joiner (another variant)
-    ]
+    # Most plain-text bodies need nothing beyond the final strip; one scan
+    # for anything the passes below would change lets them skip it all
+    if not _RE_NEEDS_CLEANING.search(content):
+        return content.strip()
 
-    for char in invisible_chars:
-        content = content.replace(char, '')
+    # Remove invisible/zero-width characters commonly used for tracking,
+    # all in one pass over the string
+    content = content.translate(_INVISIBLE_TABLE)
 
     # Clean up excessive whitespace patterns
     # Replace multiple consecutive spaces with single space
-    content = re.sub(r' {3,}', ' ', content)
+    content = _RE_SPACES.sub(' ', content)
 
     # Replace multiple consecutive line breaks with double line breaks (paragraph spacing)
-    content = re.sub(r'\n{4,}', '\n\n', content)
-
-    # Clean up lines that are just whitespace
-    lines = content.split('\n')
-    cleaned_lines = []
-    for line in lines:
-        # If line is just whitespace, replace with empty line
-        if line.strip() == '':
-            cleaned_lines.append('')
-        else:
-            cleaned_lines.append(line.strip())
+    content = _RE_NEWLINES.sub('\n\n', content)
 
-    # Rejoin and normalize paragraph spacing
-    content = '\n'.join(cleaned_lines)
+    # Strip leading/trailing whitespace from every line (whitespace-only lines
+    # become empty) in one regex pass instead of split/strip/join
+    content = _RE_LINE_EDGES.sub('', content)
 
     # Remove excessive line breaks at start/end
     content = content.strip()
 
-    # Shorten extremely long URLs (optional)
-    def shorten_url(match):
-        url = match.group(0)
-        if len(url) > 50:
-            # Extract domain (including subdomain) using urllib.parse
-            domain = urlsplit(url).netloc
-            return f"[{domain}]({url})"
-        return url
-
-    # Apply the URL shortener to every http/https link in the content
-    content = re.sub(r'https?://\S+', shorten_url, content)
+    # Shorten extremely long URLs (optional) to [domain](url); the pattern only
+    # matches links over 50 characters, so short ones are never touched
+    if 'http' in content:
+        content = _RE_LONG_URL.sub(r'[\1](\g<0>)', content)
 
     return content
 # Paths for local files (cursor) should be based on the location of this script
@@ -108,7 +144,7 @@ def clean_email_content(content):
 # Mail exports are saved to the centralized data/mail/exports/ directory.
 ROOT_DIR = Path(__file__).resolve().parent
 
-TOKEN = Path("config/mail/token.pickle")
+TOKEN = Path("config/mail/token.json")
 CURSOR = ROOT_DIR / "cursor.txt"
 OUTDIR = Path("data/mail/exports")
 
@@ -124,14 +160,16 @@ def get_creds():
     if TOKEN.exists():
         logger.info("Token file found at %s", TOKEN)
         print(f"  Token file found at {ansi.cyan}{TOKEN}{ansi.reset}")
-        creds = pickle.loads(TOKEN.read_bytes())
+        creds = Credentials.from_authorized_user_info(
+            json.loads(TOKEN.read_text(encoding="utf-8")), SCOPES
+        )
         # Handle token refresh or fallback to new OAuth flow if refresh fails
         if creds.expired and creds.refresh_token:
             logger.info("Token expired, attempting refresh...")
             print(f"  Token {ansi.yellow}expired{ansi.reset}, attempting refresh...")
             try:
                 creds.refresh(google.auth.transport.requests.Request())
-                TOKEN.write_bytes(pickle.dumps(creds))
+                TOKEN.write_text(creds.to_json(), encoding="utf-8")
                 logger.info("Token refreshed successfully.")
                 print(f"  Token refreshed {ansi.green}successfully{ansi.reset}.")
             except RefreshError as e:
@@ -157,7 +195,13 @@ def get_creds():
     # Attempt to locate the downloaded OAuth client secret JSON
     logger.warning("No token file found, starting OAuth flow...")
     print(f"  {ansi.yellow}No token file found{ansi.reset}, starting OAuth flow...")
-    secret_files = list(Path("config/mail").glob("client_secret_*.json"))
+    try:
+        with os.scandir("config/mail") as entries:
+            secret_files = [entry.path for entry in entries
+                            if entry.name.startswith("client_secret_")
+                            and entry.name.endswith(".json")]
+    except FileNotFoundError:
+        secret_files = []
     if not secret_files:
         msg = (
             f"{ansi.red}No OAuth client secret JSON found{ansi.reset}.\n"
@@ -172,12 +216,12 @@ def get_creds():
                             .replace(ansi.cyan, ''))
         print(msg)
         sys.exit(2)
-    client_secrets_file = str(secret_files[0])
+    client_secrets_file = secret_files[0]
     logger.info("Using client secrets file: %s", client_secrets_file)
     print(f"  Using client secrets file: {ansi.cyan}{client_secrets_file}{ansi.reset}")
     flow = InstalledAppFlow.from_client_secrets_file(client_secrets_file, SCOPES)
     creds = flow.run_local_server(port=0)
-    TOKEN.write_bytes(pickle.dumps(creds))
+    TOKEN.write_text(creds.to_json(), encoding="utf-8")
     logger.info("Token created and saved to %s", TOKEN)
     print(f"  Token {ansi.green}created{ansi.reset} and saved to {ansi.cyan}{TOKEN}{ansi.reset}")
     return creds
@@ -186,55 +230,299 @@ def latest_history_id(gmail):
     """Fetches the latest history ID from Gmail."""
     logger.info("Fetching latest history ID from Gmail...")
     print(f"{ansi.magenta}Fetching{ansi.reset} latest history ID from Gmail...")
-    prof = gmail.users().getProfile(userId="me").execute()
+    prof = gmail.users().getProfile(userId="me", fields="historyId").execute()
     history_id = prof["historyId"]
     logger.info("Latest history ID is %s", history_id)
     print(f"  Latest history ID is {ansi.green}{history_id}{ansi.reset}")
     return history_id
 
 def fetch_deltas(gmail, start):
-    """Fetches new messages since a given history ID."""
+    """Fetches new messages since a given history ID, following every history page."""
     logger.info("Fetching message deltas since history ID: %s", start)
     print(f"{ansi.magenta}Fetching{ansi.reset} message deltas since history ID: "
           f"{ansi.cyan}{start}{ansi.reset}")
-    page = gmail.users().history().list(
-        userId="me", startHistoryId=start, historyTypes=["messageAdded"]
-    ).execute()
+    history = gmail.users().history()
     messages = []
-    for h in page.get("history", []):
-        messages.extend(m["id"] for m in h.get("messages", []))
+    page_token = None
+    while True:
+        page = history.list(
+            userId="me", startHistoryId=start, historyTypes=["messageAdded"],
+            pageToken=page_token, fields="history/messages/id,historyId,nextPageToken"
+        ).execute()
+        for h in page.get("history", []):
+            messages.extend(m["id"] for m in h.get("messages", []))
+        page_token = page.get("nextPageToken")
+        if not page_token:
+            break
 
     new_history_id = page.get("historyId")
     logger.info("Found %d new messages. New history ID: %s", len(messages), new_history_id)
     print(f"  Found {ansi.green}{len(messages)}{ansi.reset} new messages. "
           f"New history ID: {ansi.cyan}{new_history_id or 'N/A'}{ansi.reset}")
-    return messages, page.get("historyId")
+    return messages, new_history_id
+
+def fetch_messages(gmail, mids):
+    """Fetches messages (structured `full` format) in a single batch HTTP call.
+
+    Returns a dict mapping each message ID to its API response, or to the
+    HttpError raised for that message.
+    """
+    results = {}
+
+    def on_response(request_id, response, exception):
+        results[request_id] = exception if exception is not None else response
+
+    batch = gmail.new_batch_http_request(callback=on_response)
+    messages = gmail.users().messages()
+    for mid in mids:
+        batch.add(messages.get(userId="me", id=mid, format="full", fields=MESSAGE_FIELDS),
+                  request_id=mid)
+    batch.execute()
+    return results
+
+class QuotaLimiter:
+    """Thread-safe token bucket that hands out Gmail quota units."""
+
+    def __init__(self, units_per_second):
+        self.rate = units_per_second
+        self._units = float(units_per_second)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, units):
+        """Blocks until `units` quota units are available, then takes them.
+
+        The bucket never holds more than one second's worth of units, so larger
+        requests are taken in rate-sized slices rather than waiting forever.
+        """
+        while units > 0:
+            take = min(units, self.rate)
+            self._take(take)
+            units -= take
+
+    def _take(self, units):
+        """Blocks until `units` (at most the rate) are in the bucket, then takes them."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._units = min(float(self.rate),
+                                  self._units + (now - self._stamp) * self.rate)
+                self._stamp = now
+                if self._units >= units:
+                    self._units -= units
+                    return
+                wait = (units - self._units) / self.rate
+            time.sleep(wait)
+
+def build_gmail(creds):
+    """Builds a Gmail client on its own authorized httplib2 connection.
+
+    httplib2 negotiates gzip by default, and the client library tags its
+    requests so Google serves compressed responses.
+    """
+    http = AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+    return build("gmail", "v1", http=http, cache_discovery=False)
+
+_thread_state = threading.local()
+
+def _thread_gmail(creds):
+    """Returns the calling thread's own Gmail client, building it on first use."""
+    gmail = getattr(_thread_state, "gmail", None)
+    if gmail is None:
+        gmail = build_gmail(creds)
+        _thread_state.gmail = gmail
+    return gmail
+
+def iter_fetched(creds, message_ids):
+    """Fetches messages in batches on a thread pool.
+
+    Yields (chunk, results) per batch in the original order, where results is
+    the fetch_messages() mapping. At most 2 x FETCH_WORKERS batches are queued
+    ahead of the consumer, so memory stays bounded on large archives.
+    """
+    limiter = QuotaLimiter(QUOTA_UNITS_PER_SECOND)
+
+    def fetch(chunk):
+        limiter.acquire(len(chunk) * MESSAGE_GET_UNITS)
+        try:
+            return fetch_messages(_thread_gmail(creds), chunk)
+        except HttpError as e:
+            logger.error("Batch request for %d messages failed: %s", len(chunk), e)
+            return dict.fromkeys(chunk, e)
+
+    chunks = (message_ids[i:i + BATCH_SIZE] for i in range(0, len(message_ids), BATCH_SIZE))
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        pending = deque((chunk, executor.submit(fetch, chunk))
+                        for chunk in islice(chunks, 2 * FETCH_WORKERS))
+        while pending:
+            chunk, future = pending.popleft()
+            for next_chunk in islice(chunks, 1):
+                pending.append((next_chunk, executor.submit(fetch, next_chunk)))
+            yield chunk, future.result()
+
+def _is_retryable(result):
+    """Whether a fetch_messages() result is a transient failure worth retrying."""
+    if result is None:
+        return True
+    if not isinstance(result, Exception):
+        return False
+    status = getattr(getattr(result, "resp", None), "status", None)
+    return status not in PERMANENT_ERROR_STATUSES
+
+def retry_failed(gmail, mids):
+    """Re-fetches messages whose first fetch failed transiently.
+
+    Runs on the calling thread in RETRY_BATCH_SIZE batches, up to
+    RETRY_ATTEMPTS rounds with exponential backoff. Returns a fetch_messages()
+    style mapping; messages that never succeed keep their last error.
+    """
+    results = {}
+    pending = list(mids)
+    delay = RETRY_BACKOFF
+    for _ in range(RETRY_ATTEMPTS):
+        time.sleep(delay)
+        delay *= 2
+        failed = []
+        for i in range(0, len(pending), RETRY_BATCH_SIZE):
+            chunk = pending[i:i + RETRY_BATCH_SIZE]
+            try:
+                fetched = fetch_messages(gmail, chunk)
+            except HttpError as e:
+                fetched = dict.fromkeys(chunk, e)
+            for mid in chunk:
+                results[mid] = fetched.get(mid)
+                if _is_retryable(results[mid]):
+                    failed.append(mid)
+        pending = failed
+        if not pending:
+            break
+    return results
+
+@functools.cache
+def _markitdown():
+    """Returns the shared HTML-to-markdown converter, built on first use."""
+    return MarkItDown(enable_plugins=False)
 
 def save_msg(gmail, mid):
-    """Saves a single email message to a structured markdown file."""
-    logger.info("Saving message with ID: %s", mid)
-    raw = gmail.users().messages().get(userId="me", id=mid, format="raw").execute()["raw"]
+    """Fetches a single email message and saves it to a structured markdown file."""
+    msg = gmail.users().messages().get(
+        userId="me", id=mid, format="full", fields=MESSAGE_FIELDS
+    ).execute()
+    write_msg(gmail, mid, msg)
+
+def _collect_text_parts(part, text_parts, html_parts):
+    """Walks a `full`-format MIME tree, decoding only the inline text bodies."""
+    data = part.get("body", {}).get("data")
+    if data:
+        mime_type = part.get("mimeType")
+        if mime_type == "text/plain":
+            text_parts.append(base64.urlsafe_b64decode(data).decode(errors="ignore"))
+        elif mime_type == "text/html":
+            # Kept as bytes; MarkItDown reads them straight from a stream
+            html_parts.append(base64.urlsafe_b64decode(data))
+    for sub_part in part.get("parts", ()):
+        _collect_text_parts(sub_part, text_parts, html_parts)
+
+def _parse_raw(raw):
+    """Parses a raw (base64url-encoded) RFC 822 message into headers and text parts."""
     mime = email.message_from_bytes(base64.urlsafe_b64decode(raw))
+    headers = {name: mime.get(name) for name in ("subject", "from", "to", "date")}
 
-        # Extract email metadata
-    subject = clean_subject(mime.get('Subject', 'No Subject'))
-    from_addr = mime.get('From', 'No From')
-    to_addr = mime.get('To', 'No To')
-    date_str = mime.get('Date', 'No Date')
-
-    # Extract body content - prefer plain text over HTML
     text_parts = []
     html_parts = []
-
     for part in mime.walk():
-        if part.get_content_type() == "text/plain":
+        # Only inline text bodies are decoded; containers, images and
+        # attachments are skipped without touching their payloads
+        if (part.get_content_maintype() != "text"
+                or part.get_content_disposition() == "attachment"):
+            continue
+        subtype = part.get_content_subtype()
+        if subtype == "plain":
             payload = part.get_payload(decode=True)
             if payload:
                 text_parts.append(payload.decode(errors="ignore"))
-        elif part.get_content_type() == "text/html":
+        elif subtype == "html":
             payload = part.get_payload(decode=True)
             if payload:
-                html_parts.append(payload.decode(errors="ignore"))
+                html_parts.append(payload)
+    return headers, text_parts, html_parts
+
+def _write_file(path, data):
+    """Writes bytes to `path` with raw os-level calls (create/truncate, write, close)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+class FileWriter:
+    """Writes files on a background thread so disk I/O overlaps the next fetch.
+
+    Use as a context manager; leaving the block waits for queued writes.
+    """
+
+    def __init__(self, maxsize=64):
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._run, name="gmail-writer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, path, text):
+        """Queues `text` to be written to `path` as UTF-8."""
+        self._queue.put((path, text.encode("utf-8")))
+
+    def close(self):
+        """Flushes the queue and stops the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while (item := self._queue.get()) is not None:
+            path, data = item
+            try:
+                _write_file(path, data)
+                logger.debug("Message saved to %s", path)
+            except OSError as e:
+                logger.error("Could not write %s: %s", path, e)
+                print(f"  {ansi.red}Could not write {path}:{ansi.reset} {e}")
+
+def write_msg(gmail, mid, msg, writer=None):
+    """Saves a `full`-format message to a structured markdown file.
+
+    Only the text/plain and text/html bodies are decoded. Messages whose
+    payload carries no inline text body are re-fetched in raw form and parsed
+    as MIME instead. When a FileWriter is given, the file is written on its
+    background thread.
+    """
+    payload = msg.get("payload", {})
+    headers = {}
+    for header in payload.get("headers", ()):
+        headers.setdefault(header["name"].lower(), header["value"])
+
+    # Extract body content - prefer plain text over HTML
+    text_parts = []
+    html_parts = []
+    _collect_text_parts(payload, text_parts, html_parts)
+
+    if not text_parts and not html_parts:
+        logger.info("No inline body for %s; falling back to raw format", mid)
+        raw = gmail.users().messages().get(
+            userId="me", id=mid, format="raw", fields="raw"
+        ).execute()["raw"]
+        headers, text_parts, html_parts = _parse_raw(raw)
+
+    # Extract email metadata
+    subject = clean_subject(headers.get('subject') or 'No Subject')
+    from_addr = headers.get('from') or 'No From'
+    to_addr = headers.get('to') or 'No To'
+    date_str = headers.get('date') or 'No Date'
 
     # Use MarkItDown for HTML content, keep plain text as-is (avoids encoding issues)
     if text_parts:
@@ -243,10 +531,9 @@ def save_msg(gmail, mid):
         body_content = clean_email_content(raw_content)
     elif html_parts:
         # Convert HTML to markdown using MarkItDown
-        html_content = "\n\n".join(html_parts)
-        markitdown = MarkItDown()
-        html_stream = BytesIO(html_content.encode('utf-8'))
-        markdown_result = markitdown.convert_stream(html_stream, file_extension=".html")
+        # BytesIO over the joined bytes shares their buffer rather than copying
+        html_stream = BytesIO(b"\n\n".join(html_parts))
+        markdown_result = _markitdown().convert_stream(html_stream, file_extension=".html")
         body_content = clean_email_content(markdown_result.text_content)
     else:
         body_content = "No body content found."
@@ -270,13 +557,32 @@ to: {to_addr}
 {body_content.strip()}
 """
 
-    # Parse email date using RFC 2822 parser (handles all email date formats)
-    chronodate = parsedate_to_datetime(date_str).strftime("%Y%m%d")
+    # Gmail's internalDate (epoch milliseconds) needs no parsing; the RFC 2822
+    # Date header is only parsed when it is missing
+    internal_date = msg.get("internalDate")
+    if internal_date:
+        received = datetime.fromtimestamp(int(internal_date) // 1000, tz=timezone.utc)
+    else:
+        received = parsedate_to_datetime(date_str)
+    chronodate = received.strftime("%Y%m%d")
     filename = f"{chronodate}-{clean.up(subject)}-{mid}.md"
     output_path = OUTDIR / filename
 
+    if writer is not None:
+        writer.write(output_path, structured_content)
+        return
     output_path.write_text(structured_content, encoding="utf-8")
-    logger.info("Message saved to %s", output_path)
+    logger.debug("Message saved to %s", output_path)
+
+def archived_message_ids():
+    """Returns the IDs of messages already exported to OUTDIR.
+
+    Export names end in `-<message id>.md`, so one directory scan is enough
+    to resume an interrupted archive without re-fetching what was saved.
+    """
+    with os.scandir(OUTDIR) as entries:
+        return {entry.name[:-3].rsplit('-', 1)[-1]
+                for entry in entries if entry.name.endswith('.md')}
 
 def fetch_all_message_ids(gmail):
     """Fetches all message IDs from the user's Gmail account."""
@@ -291,12 +597,14 @@ def fetch_all_message_ids(gmail):
             page_num += 1
             response = gmail.users().messages().list(
                 userId='me',
-                pageToken=page_token
+                pageToken=page_token,
+                maxResults=MAX_LIST_RESULTS,
+                fields="messages/id,nextPageToken"
             ).execute()
 
             message_batch = response.get('messages', [])
             if message_batch:
-                messages.extend(message_batch)
+                messages.extend(msg['id'] for msg in message_batch)
                 print(f"  Page {ansi.cyan}{page_num}{ansi.reset}: Found "
                       f"{ansi.green}{len(message_batch)}{ansi.reset} messages. "
                       f"Total: {ansi.green}{len(messages)}{ansi.reset}")
@@ -311,7 +619,7 @@ def fetch_all_message_ids(gmail):
 
     logger.info("Total messages found: %d", len(messages))
     print(f"Total messages found: {ansi.green}{len(messages)}{ansi.reset}")
-    return [msg['id'] for msg in messages]
+    return messages
 
 def main():
     """Synchronises Gmail messages to local markdown exports.
@@ -324,10 +632,15 @@ def main():
            so subsequent runs are incremental.
     """
 
+    # The log format uses neither, so skip the per-record thread/process lookups
+    logging.logThreads = False
+    logging.logProcesses = False
+
     logger.info("Starting Gmail sync script.")
     print("Starting Gmail sync script...")
 
-    gmail = build("gmail", "v1", credentials=get_creds(), cache_discovery=False)
+    creds = get_creds()
+    gmail = build_gmail(creds)
     logger.info("Gmail service client created successfully.")
     print(f"Gmail service client {ansi.green}created successfully{ansi.reset}.")
 
@@ -335,6 +648,8 @@ def main():
     perform_full_archive = False
     message_ids = []
     new_cursor = None
+    # Messages that failed transiently and still need fetching on a later run
+    unfinished = 0
 
     if CURSOR.exists():
         cursor = CURSOR.read_text(encoding="utf-8").strip()
@@ -362,25 +677,84 @@ def main():
         new_cursor = latest_history_id(gmail)
 
     if message_ids:
+        # Batch request IDs must be unique; history deltas can repeat a message
+        message_ids = list(dict.fromkeys(message_ids))
+
+        # Skip messages a previous (possibly interrupted) run already exported
+        archived = archived_message_ids()
+        pending_ids = [mid for mid in message_ids if mid not in archived]
+        if len(pending_ids) < len(message_ids):
+            skipped = len(message_ids) - len(pending_ids)
+            logger.info("Skipping %d already archived message(s).", skipped)
+            print(f"Skipping {ansi.yellow}{skipped}{ansi.reset} already archived message(s).")
+        message_ids = pending_ids
         total = len(message_ids)
         logger.info("Found %d message(s) to archive.", total)
         print(f"Found {ansi.green}{total}{ansi.reset} message(s) to archive.")
 
-        for i, mid in enumerate(message_ids):
-            print(f"  {ansi.magenta}Processing {i + 1}{ansi.reset}/"
-                  f"{ansi.green}{total}{ansi.reset}: {mid}")
-            try:
-                save_msg(gmail, mid)
-            except HttpError as e:
-                logger.error("Could not process message %s: %s", mid, e)
-                print(f"  {ansi.red}Could not process message {mid}:{ansi.reset} {e}")
-            # Be a good API citizen; avoid hitting rate limits.
-            time.sleep(0.05)
+        # On a terminal, progress is one line redrawn in place; when output is
+        # redirected (cron, CI) it is a plain line every PROGRESS_LOG_EVERY
+        # messages, without colour codes nobody will see
+        interactive = sys.stdout.isatty()
+        # Colour codes and the total are fixed for the run; bake them in once
+        progress_line = (f"\r  {ansi.magenta}Processing{ansi.reset} "
+                         f"{{}}/{ansi.green}{total}{ansi.reset}").format
+        error_line = (f"\n  {ansi.red}Could not process message {{}}:{ansi.reset} {{}}"
+                      if interactive else "  Could not process message {}: {}").format
+        write = sys.stdout.write
+        i = 0
+        retry_ids = []
+        with FileWriter() as writer:
+
+            def archive(mid, result):
+                """Writes one fetched message; False if it failed transiently."""
+                if result is None or isinstance(result, Exception):
+                    error = result
+                else:
+                    try:
+                        # Messages without an inline body are re-fetched in raw form
+                        write_msg(gmail, mid, result, writer)
+                        return True
+                    except HttpError as e:
+                        error = e
+                logger.error("Could not process message %s: %s", mid, error)
+                print(error_line(mid, error))
+                return not _is_retryable(error)
+
+            for chunk, results in iter_fetched(creds, message_ids):
+                for mid in chunk:
+                    i += 1
+                    if interactive:
+                        write(progress_line(i))
+                        sys.stdout.flush()
+                    elif i % PROGRESS_LOG_EVERY == 0 or i == total:
+                        print(f"  Processed {i}/{total}")
+                    result = results.get(mid)
+                    if _is_retryable(result):
+                        retry_ids.append(mid)
+                    elif not archive(mid, result):
+                        unfinished += 1
+                    if i % PROGRESS_LOG_EVERY == 0:
+                        logger.info("Archived %d/%d messages", i, total)
+
+            if retry_ids:
+                logger.warning("Retrying %d message(s) that failed to fetch.", len(retry_ids))
+                print(f"\nRetrying {ansi.yellow}{len(retry_ids)}{ansi.reset} message(s) that failed to fetch...")
+                for mid, result in retry_failed(gmail, retry_ids).items():
+                    if not archive(mid, result):
+                        unfinished += 1
+        if interactive:
+            print()
     else:
         logger.info("No new messages found.")
         print("No new messages found.")
 
-    if new_cursor:
+    if new_cursor and unfinished:
+        # Re-running from the old cursor picks these up; archived ones are skipped
+        logger.warning("%d message(s) could not be fetched; cursor not advanced.", unfinished)
+        print(f"{ansi.yellow}{unfinished} message(s) could not be fetched{ansi.reset}; "
+              "cursor not advanced so the next run retries them.")
+    elif new_cursor:
         CURSOR.write_text(str(new_cursor), encoding="utf-8")
         logger.info("Cursor updated to %s", new_cursor)
         print(f"Cursor updated to {ansi.green}{new_cursor}{ansi.reset}")
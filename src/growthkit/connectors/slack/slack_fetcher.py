@@ -8,18 +8,26 @@ import re
 import time
 import json
 import asyncio
+import logging
 import argparse
 import traceback
 import urllib.parse
 from enum import Enum
+from contextlib import asynccontextmanager
+from collections import deque
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, UTC
-from http.cookies import SimpleCookie
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, AsyncIterator, Optional, Iterator, Sequence, Tuple
 
-from playwright.async_api import async_playwright, Page, Request, Route, Error, TimeoutError
+from playwright.async_api import async_playwright, Page, Request, Error, TimeoutError
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the `speedups` extra
+    orjson = None
 
 from growthkit.utils.style import ansi
 from growthkit.utils.logs import report
@@ -33,23 +41,112 @@ logger = report.settings(__file__)
 # -------------- Config -------------------------------------------------------
 # Updated path to align with new repository structure
 EXPORT_DIR = Path("data/slack/exports")
+# Legacy per-conversation output folders next to this module
+_PROCESSED_DIR = os.path.join(os.path.dirname(__file__), 'processed')
 ROLODEX_FILE = Path("data/rolodex.json")
 TRACK_FILE = Path("config/slack/conversion_tracker.json")
 CREDENTIALS_FILE = Path("config/slack/playwright_creds.json")
 STORAGE_STATE_FILE = Path("config/slack/storage_state.json")
 CHANNEL_MAP_FILE = Path("data/slack/channel_map.json")
+CHANNELS_LISTING_FILE = CHANNEL_MAP_FILE.with_name("channels_listing.json")
+# Seconds a cached conversations.list result is reused before paging again
+_CHANNELS_LISTING_TTL = 300
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/137.0.0.0 Safari/537.36"
+)
 EXPORT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Token patterns scanned in intercepted request bodies (compiled once)
+_XOX_RE = re.compile(r'xox[a-z]-[a-zA-Z0-9-]+')
+
+# Set-Cookie values arrive newline-joined (or comma-joined); a comma only
+# separates cookies when the next token is `name=`, not inside `expires=`
+_SET_COOKIE_SPLIT_RE = re.compile(r'\n|,\s*(?=[^;,=\s]+=)')
+_COOKIE_ATTRIBUTES = frozenset({
+    "expires", "path", "domain", "max-age", "secure", "httponly", "samesite",
+    "partitioned", "priority",
+})
+
+
+def _parse_set_cookie(header: str) -> Iterator[Tuple[str, str]]:
+    """Yield (name, value) for each cookie in a Set-Cookie header, ignoring attributes."""
+    for chunk in _SET_COOKIE_SPLIT_RE.split(header):
+        name, sep, value = chunk.split(";", 1)[0].partition("=")
+        name = name.strip()
+        if not sep or not name or name.lower() in _COOKIE_ATTRIBUTES:
+            continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] == '"':
+            value = value[1:-1]
+        yield name, value
+
+
+# API calls whose responses are kept in intercepted_data, matched in one scan
+_INTERCEPT_ENDPOINTS = (
+    "conversations.history", "conversations.list", "users.list",
+    "conversations.info", "conversations.replies", "conversations.listPrefs",
+    "conversations.browse", "conversations.search", "channels.list",
+    "channels.info", "channels.browse", "channels.search",
+    "client.boot", "client.counts", "rtm.start", "rtm.connect",
+    "team.info", "workspace.info", "api",  # Include any API call
+    # Sign-in/magic code endpoints that indicate auth state
+    "signin.", "signup.", "auth.captcha", "auth.verify", "auth.magic",
+)
+_INTERCEPT_ENDPOINT_RE = re.compile("|".join(map(re.escape, _INTERCEPT_ENDPOINTS)))
+
+# URL tags for network logs; alternatives are tried in priority order and the
+# empty named group that matches becomes the tag (see _classify_slack_url)
+_CLASSIFY_RE = re.compile(
+    r"(?s)(?=.*\.slack\.com)(?:"
+    r"(?=.*/api/)(?P<api>)"
+    r"|(?=.*account\.slack\.com)(?P<account>)"
+    r"|(?=.*app\.slack\.com)(?P<app>)"
+    r"|(?=.*(?:challenge|captcha))(?P<challenge>)"
+    r"|(?=.*(?:signin|login|verify))(?P<signin>)"
+    r"|(?P<workspace>))"
+)
+
+# Endpoints that only answer ok:true once the session is logged in
+_DEFINITIVE_APIS = ("client.userBoot", "client.counts", "team.info", "users.prefs")
+
+# Response decoder; both raise a ValueError subclass on bad input
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Encode to UTF-8 JSON bytes indented by 2, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _intercepted_response(data: Dict[str, Any]) -> Any:
+    """Return the decoded body of an intercepted call, or {} if it is not valid JSON.
+
+    The result is not stored back on the entry, so intercepted_data keeps only
+    raw bytes and its memory stays bounded however often it is scanned.
+    """
+    raw = data.get("response_raw")
+    if not raw:
+        return {}
+    try:
+        return _json_loads(raw)
+    except ValueError:
+        return {}
+
+
 @dataclass(frozen=True)
 class WorkspaceSettings:
     """Workspace settings for Slack fetcher"""
     url: str
     team_id: str
+    # URL for the Slack app client, derived from team_id once at construction
+    app_client_url: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def app_client_url(self) -> str:
-        """URL for the Slack app client"""
-        return f"https://app.slack.com/client/{self.team_id}"
+    def __post_init__(self):
+        object.__setattr__(self, "app_client_url", f"https://app.slack.com/client/{self.team_id}")
 
 
 def load_workspace_settings() -> WorkspaceSettings:
@@ -103,37 +200,96 @@ class ConversationType(Enum):
 
 class ConversationInfo:
     """Data structure to hold information about a Slack conversation (channel, DM, etc.)."""
+    __slots__ = ("name", "id", "conversation_type", "is_private", "member_count", "members")
+
+    _TYPE_SYMBOL = {
+        ConversationType.CHANNEL: "#",
+        ConversationType.DM: "@",
+        ConversationType.MULTI_PERSON_DM: "👥",
+        ConversationType.UNKNOWN: "?",
+    }
+
     def __init__(self,
                  name: str,
                  conversation_id: str,
                  conversation_type: ConversationType,
                  is_private: bool = False,
                  member_count: int = 0,
-                 members: List[str] = None):
+                 members: Sequence[str] = ()):
         self.name = name
         self.id = conversation_id
         self.conversation_type = conversation_type
         self.is_private = is_private
         self.member_count = member_count
-        self.members = members or []
+        self.members = members
 
     def __repr__(self):
-        type_symbol = {
-            ConversationType.CHANNEL: "#",
-            ConversationType.DM: "@",
-            ConversationType.MULTI_PERSON_DM: "👥",
-            ConversationType.UNKNOWN: "?",
-        }
-        symbol = type_symbol.get(self.conversation_type, "?")
+        symbol = self._TYPE_SYMBOL.get(self.conversation_type, "?")
         private_marker = "🔒" if self.is_private else ""
         member_info = f" ({self.member_count} members)" if self.member_count > 0 else ""
 
         display_name = self.name or ""
-        if display_name.startswith(symbol):
+        if symbol != "?" and display_name.startswith(symbol):
             display_name = display_name[len(symbol):]
 
         return f"{symbol}{display_name}{private_marker}{member_info}"
 
+# Generated names for channels whose real name is not known yet
+_PLACEHOLDER_PREFIXES = ("channel_", "group_")
+# A lower-cased name this long starting with these is taken to be a raw C…/G… ID
+_ID_LIKE_PREFIXES = ("c", "g")
+
+# Where intercepted API responses carry channel names: (URL substring, key path to
+# an {id: channel} dict or a list of channels, name fields tried in order)
+_CHANNEL_SOURCES = (
+    ("search.modules.channels", ("channels",), ("name",)),
+    ("client.counts", ("channels",), ("name", "display_name", "real_name", "canonical_name")),
+    ("client.userBoot", ("channels",), ("name",)),
+    ("client.userBoot", ("team", "channels"), ("name",)),
+    ("team.info", ("team", "channels"), ("name",)),
+    ("conversations.list", ("channels",), ("name",)),
+    ("channels.list", ("channels",), ("name",)),
+    ("client.boot", ("team", "channels"), ("name",)),
+)
+
+
+def _iter_named_channels(node: Any, name_fields: Tuple[str, ...]) -> Iterator[Tuple[str, str]]:
+    """Yield (id, name) from an {id: channel} dict or a list of channel dicts.
+
+    The name is the first non-empty field in `name_fields`; entries without an ID
+    or a name are skipped.
+    """
+    # json.loads only produces dict/list, not subclasses
+    if type(node) is dict:
+        items = node.items()
+    elif type(node) is list:
+        items = ((ch.get("id") if type(ch) is dict else None, ch) for ch in node)
+    else:
+        return
+    for ch_id, ch in items:
+        if not ch_id or type(ch) is not dict:
+            continue
+        for name_field in name_fields:
+            if ch_name := ch.get(name_field):
+                yield ch_id, ch_name
+                break
+
+
+# API endpoints whose responses may carry conversation objects, matched in one scan
+_CONVERSATION_ENDPOINT_RE = re.compile("|".join(map(re.escape, (
+    "conversations.list",
+    "conversations.info",
+    "channels.list",
+    "channels.info",
+    "im.list",
+    "groups.list",
+    "client.counts",
+    "client.boot",
+    "client.userBoot",
+    "search.modules.people",
+    "conversations.genericInfo",
+))))
+
 # ---------------- Timing Helper -------------------------------------------
 class Stopwatch:
     """Tiny helper for ad-hoc performance tracing (seconds precision)."""
@@ -144,8 +300,9 @@ class Stopwatch:
     def lap(self, label: str) -> float:
         """Log the elapsed time since the stopwatch was created."""
         elapsed = time.perf_counter() - self.t0
-        logger.debug("%s%s: %.2fs", self.prefix, label, elapsed)
-        print(f"⏱️  {self.prefix}{label}: {ansi.yellow}{elapsed:.2f}s{ansi.reset}", flush=True)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s%s: %.2fs", self.prefix, label, elapsed)
+            print(f"⏱️  {self.prefix}{label}: {ansi.yellow}{elapsed:.2f}s{ansi.reset}", flush=True)
         return elapsed
 
 # -------------- Credential Management ----------------------------------------
@@ -158,16 +315,67 @@ class SlackCredentials:
         self.user_id: str = ""
         self.team_id: str = ""
         self.last_updated: float = 0
+        # Set on every capture; folded into last_updated when it is next read
+        self._dirty: bool = False
+        # (id of the cookies dict, joined Cookie header); reset when a cookie changes
+        self._cookie_header: Optional[Tuple[int, str]] = None
+        # Last 'd' cookie value seen and the token decoded from it ("" if none)
+        self._last_d_raw: str = ""
+        self._last_d_token: str = ""
+
+    def set_cookie(self, name: str, value: str) -> None:
+        """Store a captured cookie, invalidating the cached Cookie header if it changed."""
+        if self.cookies.get(name) != value:
+            self.cookies[name] = value
+            self._cookie_header = None
+
+    def cookie_header(self) -> str:
+        """Cookie request header for the captured cookies, rebuilt only after they change."""
+        cached = self._cookie_header
+        if cached is None or cached[0] != id(self.cookies):
+            cached = (id(self.cookies), "; ".join(f"{k}={v}" for k, v in self.cookies.items()))
+            self._cookie_header = cached
+        return cached[1]
+
+    def adopt_d_cookie(self, value: str) -> None:
+        """Take the token from a 'd' cookie value if it holds one and no token is set yet.
+
+        The cookie repeats on every request, so each distinct value is decoded once.
+        """
+        if self.token or not value:
+            return
+        if value != self._last_d_raw:
+            self._last_d_raw = value
+            # Three escaped characters fit in nine, so this decides the prefix
+            if urllib.parse.unquote(value[:9]).startswith("xox"):
+                # cookie sometimes holds xoxd- or xoxc-/xoxe-, accept any
+                self._last_d_token = urllib.parse.unquote(value)
+            else:
+                self._last_d_token = ""
+        if self._last_d_token:
+            self.token = self._last_d_token
+
+    def mark_updated(self) -> None:
+        """Note fresh credential data without reading the clock on the hot path."""
+        self._dirty = True
+
+    def _stamp(self) -> None:
+        """Move last_updated to now if anything was captured since the last stamp."""
+        if self._dirty:
+            self.last_updated = time.time()
+            self._dirty = False
 
     def is_valid(self) -> bool:
         """Check if credentials are recent and have required fields."""
         if not self.token or not self.cookies:
             return False
+        self._stamp()
         # Consider credentials stale after 1 hour
         return (time.time() - self.last_updated) < 3600
 
     def save(self):
         """Save credentials to file."""
+        self._stamp()
         data = {
             "cookies": self.cookies,
             "token": self.token,
@@ -175,7 +383,7 @@ class SlackCredentials:
             "team_id": self.team_id,
             "last_updated": self.last_updated
         }
-        CREDENTIALS_FILE.write_text(json.dumps(data, indent=2), encoding='utf-8')
+        CREDENTIALS_FILE.write_bytes(_json_dumps(data))
 
     @classmethod
     def load(cls) -> 'SlackCredentials':
@@ -183,13 +391,13 @@ class SlackCredentials:
         creds = cls()
         if CREDENTIALS_FILE.exists():
             try:
-                data = json.loads(CREDENTIALS_FILE.read_text(encoding='utf-8'))
+                data = _json_loads(CREDENTIALS_FILE.read_bytes())
                 creds.cookies = data.get("cookies", {})
                 creds.token = data.get("token", "")
                 creds.user_id = data.get("user_id", "")
                 creds.team_id = data.get("team_id", "")
                 creds.last_updated = data.get("last_updated", 0)
-            except (json.JSONDecodeError, IOError) as e:
+            except (ValueError, OSError) as e:
                 print(f"⚠️  Error loading credentials: {e}")
         return creds
 
@@ -199,16 +407,11 @@ class SlackCredentials:
         if request.method == "POST":
             try:
                 post_data = request.post_data
-                if post_data and "token" in post_data:
-                    # Extract token from form data
-                    if "xoxc-" in post_data:
-                        token_match = re.search(r'(xoxc-[a-zA-Z0-9-]+)', post_data)
-                        if token_match:
-                            self.token = token_match.group(1)
-                    # Capture any token that starts with xox(c|p|b|s|e)-
-                    token_match = re.search(r'(xox[a-z]-[a-zA-Z0-9-]+)', post_data)
+                if post_data and "token" in post_data and "xox" in post_data:
+                    # Capture any token that starts with xox(c|p|b|s|e)- from form data
+                    token_match = _XOX_RE.search(post_data)
                     if token_match:
-                        self.token = token_match.group(1)
+                        self.token = token_match.group()
             except (AttributeError, TypeError, ValueError):
                 pass
 
@@ -216,21 +419,21 @@ class SlackCredentials:
         headers = request.headers
         if "cookie" in headers:
             cookie_str = headers["cookie"]
-            # Parse cookies
+            # Parse cookies in one pass over the header
+            cookies = self.cookies
             for cookie_pair in cookie_str.split(";"):
-                if "=" in cookie_pair:
-                    key, value = cookie_pair.strip().split("=", 1)
-                    self.cookies[key] = value
+                i = cookie_pair.find("=")
+                if i < 0:
+                    continue
+                key = cookie_pair[:i].strip()
+                value = cookie_pair[i + 1:].rstrip()
+                if cookies.get(key) != value:
+                    cookies[key] = value
+                    self._cookie_header = None
 
-                    # Extract token from 'd' cookie if present
-                    if key == "d" and value and not self.token:
-                        try:
-                            decoded = urllib.parse.unquote(value)
-                            if decoded.startswith(('xox',)):
-                                # cookie sometimes holds xoxd- or xoxc-/xoxe-, accept any
-                                self.token = decoded
-                        except (ValueError, TypeError):
-                            pass
+                # Extract token from 'd' cookie if present
+                if key == "d":
+                    self.adopt_d_cookie(value)
 
         # Update from response data if available
         if response_data:
@@ -240,74 +443,122 @@ class SlackCredentials:
                 self.team_id = response_data["team_id"]
 
         if self.token:  # Only update timestamp if we got something useful
-            self.last_updated = time.time()
+            self._dirty = True
 
 
 # -------------- Playwright Browser Manager ----------------------------------
 
 class SlackBrowser:
     """Manages a Playwright browser instance for automated Slack data extraction."""
+    # Responses larger than this are passed through but not kept in intercepted_data
+    MAX_INTERCEPT_BYTES = 2 * 1024 * 1024
+    # Only the most recent calls are kept; older bodies are dropped with them
+    MAX_INTERCEPTED_CALLS = 2048
+    # conversations.info lookups in flight while resolving placeholder channel names
+    CHANNEL_INFO_CONCURRENCY = 16
+
+    # Common login/magic-code/captcha elements, joined so one query checks them all
+    _LOGIN_SELECTOR = ", ".join([
+        'input[type="email"]',
+        'input[name="email"]',
+        'input[type="password"]',
+        '[data-qa="signin_form"]',
+        '[data-qa="signin_button"]',
+        # Magic code / OTP inputs
+        'input[name="pin"]',
+        '[data-qa="magic_code_input"]',
+        'input[autocomplete="one-time-code"]',
+        # Captcha iframes
+        'iframe[src*="hcaptcha"]',
+        'iframe[src*="recaptcha"]',
+    ])
+    # Generic textual hints (Playwright text pseudo-classes)
+    _LOGIN_TEXT_SELECTOR = ", ".join([
+        ':text-is("Enter your code")',
+        ':text-is("We sent you a code")',
+        ':text-is("Verify your identity")',
+        ':text-is("Just a moment")',
+    ])
+    # DOM indicators of a loaded workspace
+    _AUTH_SELECTOR = ", ".join([
+        '[data-qa="workspace_name"]', '[data-qa="team_name"]', '.p-ia__sidebar',
+        '.p-channel_sidebar', '.p-workspace__sidebar', '.c-team_sidebar',
+        '.c-workspace_sidebar', '[data-qa="sidebar"]', '.c-message_input',
+        '.p-message_input', '[data-qa="message_input"]',
+    ])
+
     def __init__(self, settings: WorkspaceSettings):
         self.page: Optional[Page] = None
         self.context = None
         self.browser = None
         self.credentials = SlackCredentials.load()
-        self.intercepted_data: List[Dict[str, Any]] = []
+        self.intercepted_data: deque = deque(maxlen=self.MAX_INTERCEPTED_CALLS)
+        # Total responses ever stored; len(intercepted_data) stalls once the deque is full
+        self._intercept_count = 0
         self.user_mappings: Dict[str, str] = {}
         self.channel_mappings: Dict[str, str] = {}
+        # Placeholder names for DM members missing from user_mappings; the same
+        # colleagues recur across many multi-person DMs
+        self._unknown_user_name_cache: Dict[str, str] = {}
         self.settings = settings
         self.use_storage_state: bool = True
         self._dialog_dismiss_enabled: bool = True
+        # Set by the interceptor on the first ok:true definitive API response
+        self._auth_event = asyncio.Event()
+        # Page events are queued for long-lived workers rather than one Task each
+        self._response_queue: asyncio.Queue = asyncio.Queue()
+        self._dialog_queue: asyncio.Queue = asyncio.Queue()
+        self._event_workers: List[asyncio.Task] = []
+        # Page pool handed out by acquire_page(); self.page is its first member
+        self._idle_pages: List[Page] = []
+        self._page_slots = asyncio.Semaphore(1)
+        self._pool_contexts: List[Any] = []
+        # Successful conversations.info answers by channel ID, for this session
+        self._channel_info_cache: Dict[str, Dict[str, Any]] = {}
+        # (directory, mtime_ns) -> subdirectory names, see _processed_subdirs
+        self._processed_dir_cache: Optional[Tuple[Tuple[str, int], List[str]]] = None
+        # Keep-alive pool for direct Web API calls; shared by the worker threads,
+        # so sized above CHANNEL_INFO_CONCURRENCY
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
 
     async def start(
         self,
         headless: bool = False,
         use_storage_state: bool = True,
         fresh: bool = False,
+        concurrency: int = 1,
     ):
         """Start browser and setup interception.
 
         Always uses an isolated Playwright context. Optionally restores session from
         a saved storage state file and/or injects cookies as a fallback.
+        `concurrency` caps how many pages acquire_page() hands out at once.
         """
         self.use_storage_state = use_storage_state
         playwright = await async_playwright().start()
 
         # Always start a fresh, non-persistent browser
         self.browser = await playwright.chromium.launch(headless=headless)
-        user_agent = (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/137.0.0.0 Safari/537.36"
-        )
 
         # Prefer storage_state if enabled and available (and not fresh)
         if use_storage_state and not fresh and STORAGE_STATE_FILE.exists():
             self.context = await self.browser.new_context(
-                user_agent=user_agent,
+                user_agent=USER_AGENT,
                 storage_state=str(STORAGE_STATE_FILE),
             )
             print(f"🔐 Loaded storage state from {STORAGE_STATE_FILE}")
         else:
             # Create an empty context
-            self.context = await self.browser.new_context(user_agent=user_agent)
+            self.context = await self.browser.new_context(user_agent=USER_AGENT)
 
             # Inject cookies as a best-effort fallback, unless fresh
             if not fresh and self.credentials.cookies:
-                cookies = []
-                for name, value in self.credentials.cookies.items():
-                    cookies.append({
-                        "name": name,
-                        "value": value,
-                        "domain": ".slack.com",
-                        "path": "/",
-                    })
-                    cookies.append({
-                        "name": name,
-                        "value": value,
-                        "domain": "app.slack.com",
-                        "path": "/",
-                    })
+                # A .slack.com cookie is already sent to app.slack.com and workspace subdomains
+                cookies = [
+                    {"name": name, "value": value, "domain": ".slack.com", "path": "/"}
+                    for name, value in self.credentials.cookies.items()
+                ]
                 await self.context.add_cookies(cookies)
                 print("🍪 Injected cookies into fresh context")
 
@@ -315,28 +566,69 @@ class SlackBrowser:
         self.page = await self.context.new_page()
         print("📄 Created new browser page")
 
-        # Setup request/response interception
-        await self.page.route("**/api/**", self._intercept_api_call)
-        print("🔍 Set up API interception for **/api/**")
-
-        # Enable verbose network logging by default for debugging
-        # Request handler is sync; response uses async task to avoid blocking
+        # Enable verbose network logging by default for debugging; API responses are
+        # captured from the same listener instead of routing every call through Python.
+        # Request handler is sync; responses and dialogs are queued for one worker each
+        self._event_workers = [
+            asyncio.create_task(self._drain_events(self._response_queue, self._on_response_event)),
+            asyncio.create_task(self._drain_events(self._dialog_queue, self._on_dialog_event)),
+        ]
         self.page.on("request", self._on_request_event)
-        self.page.on("response", lambda r: asyncio.create_task(self._on_response_event(r)))
+        self.page.on("response", self._response_queue.put_nowait)
+        logger.debug("Capturing API responses for /api/")
 
         # Auto-dismiss native app-open dialogs if they appear
-        async def _on_dialog(dialog):
+        self.page.on("dialog", self._dialog_queue.put_nowait)
+
+        self._idle_pages = [self.page]
+        self._page_slots = asyncio.Semaphore(max(1, concurrency))
+
+    @asynccontextmanager
+    async def acquire_page(self) -> AsyncIterator[Page]:
+        """Borrow a page for one unit of work, waiting while `concurrency` are in use.
+
+        The main page is lent first. Extra pages get their own context, cloned from
+        the main context's current session, and are kept for reuse until close().
+        """
+        async with self._page_slots:
+            page = self._idle_pages.pop() if self._idle_pages else await self._new_pool_page()
             try:
-                logger.info("DIALOG %s: %s", dialog.type, dialog.message)
-                if self._dialog_dismiss_enabled:
-                    await dialog.dismiss()
-                    logger.info("Dialog dismissed")
-                else:
-                    await dialog.accept()
-            except (Error, TimeoutError):
-                pass
+                yield page
+            finally:
+                self._idle_pages.append(page)
+
+    async def _new_pool_page(self) -> Page:
+        """Open a page in a new context sharing the main session and event workers."""
+        state = await self.context.storage_state()
+        context = await self.browser.new_context(user_agent=USER_AGENT, storage_state=state)
+        self._pool_contexts.append(context)
+        page = await context.new_page()
+        page.on("response", self._response_queue.put_nowait)
+        page.on("dialog", self._dialog_queue.put_nowait)
+        logger.debug("Opened pooled page %d", len(self._pool_contexts))
+        return page
+
+    @staticmethod
+    async def _drain_events(queue: asyncio.Queue, handler) -> None:
+        """Await handler for each queued page event, in arrival order."""
+        while True:
+            event = await queue.get()
+            try:
+                await handler(event)
+            except Exception:  # one bad event must not stop the shared worker
+                logger.exception("Unhandled error in page event handler")
 
-        self.page.on("dialog", lambda d: asyncio.create_task(_on_dialog(d)))
+    async def _on_dialog_event(self, dialog) -> None:
+        """Dismiss (or accept) native dialogs such as the open-desktop-app prompt."""
+        try:
+            logger.info("DIALOG %s: %s", dialog.type, dialog.message)
+            if self._dialog_dismiss_enabled:
+                await dialog.dismiss()
+                logger.info("Dialog dismissed")
+            else:
+                await dialog.accept()
+        except (Error, TimeoutError):
+            pass
 
     async def _save_storage_state_if_enabled(self) -> None:
         """Persist current storage state if enabled."""
@@ -349,105 +641,89 @@ class SlackBrowser:
         except (Error, TimeoutError, OSError, ValueError) as e:
             logger.warning("Failed to save storage state: %s", e)
 
-    async def _intercept_api_call(self, route: Route, request: Request):
-        """Intercept Slack API calls to extract credentials and data."""
-        try:
-            # Continue the request
-            response = await route.fetch()
+    async def _capture_api_response(self, response) -> None:
+        """Record a Slack API response and harvest credentials from it.
 
+        Runs from the response listener, so the page's request is never stalled
+        waiting on Python.
+        """
+        request = response.request
+        url = request.url
+        try:
             # Update credentials from this request
             self.credentials.update_from_request(request)
-
-            # Debug: Log all API calls
-            if "/api/" in request.url:
-                logger.debug("Intercepted API call: %s", request.url)
+            logger.debug("Intercepted API call: %s", url)
 
             # Capture Set-Cookie from response headers to improve credential capture
             try:
-                headers = response.headers
-                set_cookie = headers.get("set-cookie") if isinstance(headers, dict) else None
+                set_cookie = await response.header_value("set-cookie")
                 if set_cookie:
-                    sc = SimpleCookie()
-                    sc.load(set_cookie)
-                    for morsel in sc.values():
-                        name = morsel.key
-                        value = morsel.value
-                        if name and value:
-                            self.credentials.cookies[name] = value
+                    for name, value in _parse_set_cookie(set_cookie):
+                        if value:
+                            self.credentials.set_cookie(name, value)
                             # Token occasionally rides in 'd' cookie or similar
-                            if name == "d" and value and not self.credentials.token:
-                                try:
-                                    decoded = urllib.parse.unquote(value)
-                                    if decoded.startswith(('xox',)):
-                                        self.credentials.token = decoded
-                                except (ValueError, TypeError):
-                                    pass
-                    self.credentials.last_updated = time.time()
+                            if name == "d":
+                                self.credentials.adopt_d_cookie(value)
+                    self.credentials.mark_updated()
             except Exception:
                 pass
 
             # If this is an API call we're interested in, store the response
-            if any(endpoint in request.url for endpoint in [
-                "conversations.history", "conversations.list", "users.list",
-                "conversations.info", "conversations.replies", "conversations.listPrefs",
-                "conversations.browse", "conversations.search", "channels.list",
-                "channels.info", "channels.browse", "channels.search",
-                "client.boot", "client.counts", "rtm.start", "rtm.connect",
-                "team.info", "workspace.info", "api",  # Include any API call
-                # Sign-in/magic code endpoints that indicate auth state
-                "signin.", "signup.", "auth.captcha", "auth.verify", "auth.magic"
-            ]):
-                try:
-                    response_text = await response.text()
-                    response_data = json.loads(response_text)
-
-                    self.intercepted_data.append({
-                        "url": request.url,
-                        "method": request.method,
-                        "post_data": request.post_data,
-                        "response": response_data,
-                        "timestamp": time.time()
-                    })
-
-                    logger.debug("Stored API response: %s (%d bytes)", request.url, len(response_text))
-
-                    # Update credentials from response if it contains user/team info
-                    self.credentials.update_from_request(request, response_data)
-
-                except json.JSONDecodeError as e:
-                    print(f"⚠️  Error parsing API response: {e}")
-
-            # Continue with the response
-            await route.fulfill(response=response)
+            if not _INTERCEPT_ENDPOINT_RE.search(url):
+                return
+            try:
+                raw = await response.body()
+                if len(raw) > self.MAX_INTERCEPT_BYTES:
+                    logger.debug("Skipped storing API response: %s (%d bytes)", url, len(raw))
+                    return
+                if raw.lstrip()[:1] not in (b"{", b"["):
+                    return
+                # Keep the bytes; consumers decode via _intercepted_response
+                entry = {
+                    "url": url,
+                    "method": request.method,
+                    "post_data": request.post_data,
+                    "response_raw": raw,
+                    "timestamp": time.time()
+                }
+                self.intercepted_data.append(entry)
+                self._intercept_count += 1
+                logger.debug("Stored API response: %s (%d bytes)", url, len(raw))
+
+                # Decoded at most once here, and only when something below needs it
+                resp = None
+
+                # Wake _wait_for_manual_login as soon as a post-login API succeeds
+                if not self._auth_event.is_set() and any(api in url for api in _DEFINITIVE_APIS):
+                    resp = _intercepted_response(entry)
+                    if isinstance(resp, dict) and resp.get("ok"):
+                        self._auth_event.set()
+
+                # Update credentials from response if it contains user/team info
+                if b'"user_id"' in raw or b'"team_id"' in raw:
+                    if resp is None:
+                        resp = _intercepted_response(entry)
+                    self.credentials.update_from_request(request, resp)
+
+            except ValueError as e:
+                logger.warning("Error parsing API response %s: %s", url, e)
 
         except (TimeoutError, Error) as e:
-            print(f"⚠️  Error intercepting request: {e}")
-            await route.continue_()
+            logger.warning("Error intercepting request %s: %s", url, e)
 
     # -------------- Network logging helpers ----------------------------------
     def _classify_slack_url(self, url: str) -> str:
         """Return a small tag describing the kind of Slack URL for log context."""
         try:
-            if not url:
-                return "other"
-            if "/api/" in url and ".slack.com" in url:
-                return "api"
-            if "account.slack.com" in url:
-                return "account"
-            if "app.slack.com" in url:
-                return "app"
-            if ".slack.com" in url and ("challenge" in url or "captcha" in url):
-                return "challenge"
-            if ".slack.com" in url and ("signin" in url or "login" in url or "verify" in url):
-                return "signin"
-            if ".slack.com" in url:
-                return "workspace"
-            return "other"
+            m = _CLASSIFY_RE.match(url) if url else None
+            return m.lastgroup if m else "other"
         except (AttributeError, ValueError, TypeError):
             return "other"
 
     def _on_request_event(self, request: Request) -> None:
         """Lightweight request logger – avoids awaiting to keep perf overhead low."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         try:
             url = request.url
             method = request.method
@@ -458,29 +734,34 @@ class SlackBrowser:
             pass
 
     async def _on_response_event(self, response) -> None:
-        """Response logger – captures status and content-type for debugging."""
+        """Response logger – captures status and content-type, and records API calls."""
         try:
             url = response.url
-            status = response.status
-            headers = response.headers or {}
-            content_type = headers.get("content-type")
-            tag = self._classify_slack_url(url)
-            logger.info("HTTP RES %s %s [%s] ct=%s", status, url, tag, content_type)
+            if logger.isEnabledFor(logging.INFO):
+                status = response.status
+                headers = response.headers or {}
+                content_type = headers.get("content-type")
+                tag = self._classify_slack_url(url)
+                logger.info("HTTP RES %s %s [%s] ct=%s", status, url, tag, content_type)
         except (Error, TimeoutError, AttributeError):
-            pass
+            return
+        if "/api/" in url:
+            await self._capture_api_response(response)
 
-    async def _is_login_or_captcha_visible(self) -> bool:
+    async def _is_login_or_captcha_visible(self, url: Optional[str] = None) -> bool:
         """Best-effort detection of Slack login/magic-code/captcha screens.
 
-        Never navigates; only inspects the current page URL and DOM.
+        Never navigates; only inspects the current page URL (or the `url` the caller
+        already read) and DOM.
         """
         if not self.page:
             return False
 
-        try:
-            url = self.page.url
-        except (Error, AttributeError):
-            url = ""
+        if url is None:
+            try:
+                url = self.page.url
+            except (Error, AttributeError):
+                url = ""
 
         # URL heuristics
         url_indicators = [
@@ -489,31 +770,12 @@ class SlackBrowser:
         if any(ind in url for ind in url_indicators):
             return True
 
-        # DOM heuristics: common login/magic-code/captcha elements
-        selectors = [
-            'input[type="email"]',
-            'input[name="email"]',
-            'input[type="password"]',
-            '[data-qa="signin_form"]',
-            '[data-qa="signin_button"]',
-            # Magic code / OTP inputs
-            'input[name="pin"]',
-            '[data-qa="magic_code_input"]',
-            'input[autocomplete="one-time-code"]',
-            # Captcha iframes
-            'iframe[src*="hcaptcha"]',
-            'iframe[src*="recaptcha"]',
-            # Generic textual hints
-            ':text-is("Enter your code")',
-            ':text-is("We sent you a code")',
-            ':text-is("Verify your identity")',
-            ':text-is("Just a moment")',
-        ]
+        # DOM heuristics: one round-trip for the CSS selectors, one for the text hints
         try:
-            for sel in selectors:
-                el = await self.page.query_selector(sel)
-                if el:
-                    return True
+            if await self.page.query_selector(self._LOGIN_SELECTOR):
+                return True
+            if await self.page.locator(self._LOGIN_TEXT_SELECTOR).count():
+                return True
         except (TimeoutError, Error):
             # Non-fatal – if selectors fail, we simply don't detect
             pass
@@ -529,26 +791,19 @@ class SlackBrowser:
             return False
 
         # DOM indicators of a loaded workspace
-        dom_selectors = [
-            '[data-qa="workspace_name"]', '[data-qa="team_name"]', '.p-ia__sidebar',
-            '.p-channel_sidebar', '.p-workspace__sidebar', '.c-team_sidebar',
-            '.c-workspace_sidebar', '[data-qa="sidebar"]', '.c-message_input',
-            '.p-message_input', '[data-qa="message_input"]',
-        ]
-        for sel in dom_selectors:
-            try:
-                el = await self.page.query_selector(sel)
-                if el:
-                    return True
-            except (TimeoutError, Error):
-                continue
+        try:
+            if await self.page.query_selector(self._AUTH_SELECTOR):
+                return True
+        except (TimeoutError, Error):
+            pass
 
         # API indicators: look for specific endpoints in intercepted data
-        definitive_apis = ["client.userBoot", "client.counts", "team.info", "users.prefs"]
         for data in self.intercepted_data:
             url = data.get("url", "")
-            resp = data.get("response", {})
-            if any(api in url for api in definitive_apis) and isinstance(resp, dict) and resp.get("ok"):
+            if not any(api in url for api in _DEFINITIVE_APIS):
+                continue
+            resp = _intercepted_response(data)
+            if isinstance(resp, dict) and resp.get("ok"):
                 # Ensure the response contains expected structures
                 keys = set(resp.keys())
                 if ("users" in keys) or ("team" in keys) or ("channels" in keys):
@@ -556,12 +811,13 @@ class SlackBrowser:
 
         return False
 
-    def _on_app_client(self) -> bool:
-        """Return True if the current page is already the app client for this TEAM_ID."""
+    def _on_app_client(self, url: Optional[str] = None) -> bool:
+        """Return True if the current page (or `url`) is already the app client for this TEAM_ID."""
         try:
-            if not self.page:
-                return False
-            url = self.page.url
+            if url is None:
+                if not self.page:
+                    return False
+                url = self.page.url
             return ("app.slack.com/client/" in url) and (self.settings.team_id in url)
         except (Error, AttributeError):
             return False
@@ -569,7 +825,8 @@ class SlackBrowser:
     async def _wait_for_manual_login(self, timeout_seconds: int = 300) -> bool:
         """Allow the user to complete interactive login without navigating away.
 
-        Periodically checks for authenticated state and returns when detected or timeout.
+        Checks for authenticated state between waits on the interceptor's auth event,
+        so a definitive API response ends the wait immediately instead of at the next poll.
         """
         if not self.page:
             return False
@@ -577,12 +834,12 @@ class SlackBrowser:
         print("🔐 Login UI detected. Waiting for you to complete sign-in…")
         print(f"   We'll monitor for up to {timeout_seconds//60} minutes and continue automatically once you're in.")
 
-        start = time.time()
-        while (time.time() - start) < timeout_seconds:
+        deadline = time.time() + timeout_seconds
+        while time.time() < deadline:
+            # Sleep until the next DOM check, waking early if a post-login API call lands
             try:
-                # Give the page a moment for any transitions
-                await self.page.wait_for_timeout(1000)
-            except (TimeoutError, Error):
+                await asyncio.wait_for(self._auth_event.wait(), timeout=1.5)
+            except asyncio.TimeoutError:
                 pass
 
             # If authenticated, persist state and continue
@@ -592,12 +849,31 @@ class SlackBrowser:
                 return True
 
             # If still on login/captcha, keep waiting; don't navigate
-            # Small extra sleep to avoid busy loop
-            await asyncio.sleep(0.5)
+            self._auth_event.clear()
 
         print("⏳ Login wait timed out. Still not authenticated.")
         return False
 
+    async def _wait_for_auth_signal(self, timeout_seconds: float) -> Optional[str]:
+        """Race the workspace DOM markers against the interceptor's auth event.
+
+        Returns "dom" or "api" for whichever appeared first, or None on timeout.
+        """
+        dom_task = asyncio.create_task(
+            self.page.locator(self._AUTH_SELECTOR).first.wait_for(timeout=timeout_seconds * 1000)
+        )
+        api_task = asyncio.create_task(self._auth_event.wait())
+        done, pending = await asyncio.wait(
+            {dom_task, api_task}, timeout=timeout_seconds, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in pending:
+            task.cancel()
+        if dom_task in done and dom_task.exception() is None:
+            return "dom"
+        if api_task in done:
+            return "api"
+        return None
+
     async def ensure_logged_in(self) -> bool:
         """Ensure we're logged in to Slack workspace."""
         if not self.page:
@@ -627,14 +903,20 @@ class SlackBrowser:
             await self.page.wait_for_timeout(500)  # brief pause to let API calls begin
             sw.lap("post-check 0.5s")
 
+            # Both checks below look at the same, not-yet-navigated page
+            try:
+                url_now = self.page.url
+            except (Error, AttributeError):
+                url_now = ""
+
             # If we're already on the app client, we're done
-            if self._on_app_client():
+            if self._on_app_client(url_now):
                 await self._save_storage_state_if_enabled()
                 await self.save_credentials()
                 return True
 
             # If login or captcha UI is visible, wait for user to complete, then prefer app client
-            if await self._is_login_or_captcha_visible():
+            if await self._is_login_or_captcha_visible(url_now):
                 success = await self._wait_for_manual_login(timeout_seconds=600)
                 if success:
                     # If authenticated and not already on app client, open app client
@@ -650,46 +932,30 @@ class SlackBrowser:
                         return True
                 # If we timed out, continue with additional checks below
 
-            # Fallback: Try to find elements that indicate we're logged in
-            await self.page.wait_for_timeout(3000)
-
-            logged_in_selectors = [
-                '[data-qa="workspace_name"]',
-                '[data-qa="team_name"]',
-                '.p-ia__sidebar',
-                '.p-channel_sidebar',
-                '.p-workspace__sidebar',
-                '.c-team_sidebar',
-                '.c-workspace_sidebar',
-                # More generic selectors
-                '[data-qa="sidebar"]',
-                '.c-message_input',
-                '.p-message_input',
-                '[data-qa="message_input"]'
-            ]
-
-            for selector in logged_in_selectors:
-                try:
-                    element = await self.page.wait_for_selector(selector, timeout=2000)
-                    if element:
-                        print(f"✅ Login confirmed via DOM element: {selector}")
-                        return True
-                except (TimeoutError, Error):  # Playwright timeout or other selector errors
-                    continue
+            # Fallback: wait for elements that indicate we're logged in, or a
+            # definitive API response (checked below), whichever shows up first
+            if await self._wait_for_auth_signal(timeout_seconds=8) == "dom":
+                print("✅ Login confirmed via DOM element")
+                return True
+            sw.lap("auth signal")
 
             # As a last check, only treat API activity as authenticated if we saw
-            # definitive post-login endpoints with ok:true OR signin success
-            definitive_apis = ["client.userBoot", "client.counts", "team.info", "users.prefs"]
-            for data in self.intercepted_data:
+            # definitive post-login endpoints with ok:true OR signin success.
+            # Iterate a snapshot: the response worker appends during the awaits below.
+            for data in list(self.intercepted_data):
                 url = data.get("url", "")
-                resp = data.get("response", {})
-                if any(api in url for api in definitive_apis) and isinstance(resp, dict) and resp.get("ok"):
+                is_definitive = any(api in url for api in _DEFINITIVE_APIS)
+                is_signin = "signin." in url or "signup." in url or "auth.magic" in url or "auth.verify" in url
+                if not (is_definitive or is_signin):
+                    continue
+                resp = _intercepted_response(data)
+                if is_definitive and isinstance(resp, dict) and resp.get("ok"):
                     print(f"✅ Confirmed login via API: {url}")
                     await self._save_storage_state_if_enabled()
                     await self.save_credentials()
                     return True
                 # Sign-in success on workspace domain (pre-app) – treat as authenticated
-                if ("signin." in url or "signup." in url or "auth.magic" in url or "auth.verify" in url) and isinstance(resp, dict) and resp.get("ok"):
+                if is_signin and isinstance(resp, dict) and resp.get("ok"):
                     print(f"✅ Sign-in completed on workspace domain: {url}")
                     # Open app client only if not already there
                     if not self._on_app_client():
@@ -729,12 +995,16 @@ class SlackBrowser:
         if not isinstance(conv_data, dict):
             return None
 
-        name = conv_data.get("name", "")
-        conv_id = conv_data.get("id", "")
-
+        get = conv_data.get
+        conv_id = get("id", "")
         if not conv_id:
             return None
 
+        name = get("name", "")
+        members = get("members")
+        if type(members) is not list:
+            members = ()
+
         # Get user and channel mappings for better naming
         user_mappings = getattr(self, 'user_mappings', {})
         channel_mappings = getattr(self, 'channel_mappings', {})
@@ -750,39 +1020,35 @@ class SlackBrowser:
                 name = f"@{name}"
 
         # Check if it's a DM (starts with D)
-        elif conv_id.startswith('D'):
+        elif (prefix := conv_id[0]) == 'D':
             # Check if it's a multi-person DM
-            if conv_data.get("is_mpim", False) or conv_data.get("is_group", False):
+            if get("is_mpim") or get("is_group"):
                 conversation_type = ConversationType.MULTI_PERSON_DM
                 # Try to get user names for multi-person DM
                 if not name:
-                    user_ids = conv_data.get("members", [])
-                    if user_ids:
-                        user_names = []
-                        for user_id in user_ids[:3]:  # Limit to first 3 users
-                            if user_id in user_mappings:
-                                user_names.append(user_mappings[user_id])
-                            else:
-                                user_names.append(f"user_{user_id[-6:]}")
-                        if user_names:
-                            name = f"@{'_'.join(user_names)}"
-                        else:
-                            name = f"@mpim_{conv_id}"
-                    else:
-                        name = f"@mpim_{conv_id}"
+                    unknown_cache = self._unknown_user_name_cache
+                    user_names = []
+                    for user_id in members[:3]:  # Limit to first 3 users
+                        name_for_uid = user_mappings.get(user_id)
+                        if name_for_uid is None:
+                            name_for_uid = unknown_cache.get(user_id)
+                            if name_for_uid is None:
+                                name_for_uid = unknown_cache[user_id] = f"user_{user_id[-6:]}"
+                        user_names.append(name_for_uid)
+                    name = f"@{'_'.join(user_names)}" if user_names else f"@mpim_{conv_id}"
             else:
                 # Regular DM
                 conversation_type = ConversationType.DM
                 if not name:
                     # Try to get the other user's name
-                    user_id = conv_data.get("user", "")
+                    user_id = get("user", "")
                     if user_id and user_id in user_mappings:
                         name = f"@{user_mappings[user_id]}"
                     else:
                         name = f"@dm_{conv_id}"
 
         # Check if it's a channel (starts with C)
-        elif conv_id.startswith('C'):
+        elif prefix == 'C':
             conversation_type = ConversationType.CHANNEL
             # Use channel mapping if available
             if conv_id in channel_mappings:
@@ -793,7 +1059,7 @@ class SlackBrowser:
                 name = f"#channel_{conv_id}"
 
         # Check if it's a group (starts with G)
-        elif conv_id.startswith('G'):
+        elif prefix == 'G':
             conversation_type = ConversationType.MULTI_PERSON_DM
             if conv_id in channel_mappings:
                 name = channel_mappings[conv_id]
@@ -813,35 +1079,22 @@ class SlackBrowser:
             else:
                 name = f"unknown_{conv_id}"
 
-        # Get member count
-        member_count = 0
-        if "num_members" in conv_data:
-            member_count = conv_data["num_members"]
-        elif "members" in conv_data and isinstance(conv_data["members"], list):
-            member_count = len(conv_data["members"])
-
-        # Get members list
-        members = []
-        if "members" in conv_data and isinstance(conv_data["members"], list):
-            members = conv_data["members"]
-
-        # Check if private
-        is_private = conv_data.get("is_private", False)
-
-        return ConversationInfo(
-            name=name,
-            conversation_id=conv_id,
-            conversation_type=conversation_type,
-            is_private=is_private,
-            member_count=member_count,
-            members=members
-        )
+        member_count = get("num_members")
+        if member_count is None:
+            member_count = len(members)
 
+        return ConversationInfo(name, conv_id, conversation_type,
+                                get("is_private", False), member_count, members)
 
+    async def get_channel_list(self, refresh: bool = False) -> Dict[str, str]:
+        """Get channel list from processed files and API data.
 
-    async def get_channel_list(self) -> Dict[str, str]:
-        """Get channel list from processed files and API data."""
+        A conversations.list result younger than _CHANNELS_LISTING_TTL is
+        reused from disk unless ``refresh`` is set.
+        """
         print("🔗 Getting channel list...")
+        # Checked once; the per-channel debug lines below run inside hot loops
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
         channels: Dict[str, str] = {}
         # Pre-populate with entries from persistent channel map
@@ -854,33 +1107,35 @@ class SlackBrowser:
 
         try:
             # Check processed directories for known channel names
-            processed_dir = os.path.join(os.path.dirname(__file__), 'processed')
-            if os.path.exists(processed_dir):
-                for item in os.listdir(processed_dir):
-                    item_path = os.path.join(processed_dir, item)
-                    if os.path.isdir(item_path):
-                        # This is a known channel/DM name
-                        if item.startswith('sb-'):
-                            # This looks like a channel name
-                            channels[item] = f"#{item}"
-                        elif item.startswith('dm_'):
-                            # This is a DM name
-                            channels[item] = f"@{item}"
+            for item in self._processed_subdirs(_PROCESSED_DIR):
+                # This is a known channel/DM name
+                if item.startswith('sb-'):
+                    # This looks like a channel name
+                    channels[item] = f"#{item}"
+                elif item.startswith('dm_'):
+                    # This is a DM name
+                    channels[item] = f"@{item}"
 
             # Also check exports directory
             if EXPORT_DIR.exists():
-                for item in os.listdir(EXPORT_DIR):
-                    if item.endswith('.md'):
-                        # Remove .md extension
-                        name = item[:-3]
-                        if name.startswith('sb-'):
-                            channels[name] = f"#{name}"
-                        elif name.startswith('dm_'):
-                            channels[name] = f"@{name}"
+                with os.scandir(EXPORT_DIR) as entries:
+                    for entry in entries:
+                        if entry.name.endswith('.md') and entry.is_file():
+                            # Remove .md extension
+                            name = entry.name[:-3]
+                            if name.startswith('sb-'):
+                                channels[name] = f"#{name}"
+                            elif name.startswith('dm_'):
+                                channels[name] = f"@{name}"
 
             # --------------- Direct Web API list fast-path -----------------
-            if self.credentials.token and self.credentials.cookies:
+            listing = None if refresh else self._load_channels_listing_cache()
+            if listing is not None:
+                channels.update(listing)
+                logger.debug("Loaded %d channels from cached conversations.list", len(listing))
+            elif self.credentials.token and self.credentials.cookies:
                 try:
+                    listing = {}
                     cursor = None
                     while True:
                         payload = {
@@ -891,16 +1146,16 @@ class SlackBrowser:
                             payload["cursor"] = cursor
                         resp = self._api_post_sync("conversations.list", payload)
                         if not resp.get("ok"):
+                            listing = None  # incomplete listing; don't cache it
                             break
                         for ch in resp.get("channels", []):
-                            if isinstance(ch, dict):
-                                ch_id = ch.get("id")
-                                ch_name = ch.get("name")
-                                if ch_id and ch_name:
-                                    channels[ch_id] = f"#{ch_name}"
+                            if type(ch) is dict and (ch_id := ch.get("id")) and (ch_name := ch.get("name")):
+                                channels[ch_id] = listing[ch_id] = f"#{ch_name}"
                         cursor = resp.get("response_metadata", {}).get("next_cursor")
                         if not cursor:
                             break
+                    if listing is not None:
+                        self._save_channels_listing_cache(listing)
                     logger.debug("Loaded %d channels via conversations.list fast path", len(channels))
                 except requests.exceptions.RequestException as exc:
                     logger.debug("conversations.list fast path failed: %s", exc)
@@ -908,144 +1163,28 @@ class SlackBrowser:
             # Extract channels from API data - enhanced extraction
             for data in self.intercepted_data:
                 url = data.get("url", "")
-                response = data.get("response", {})
+                response = _intercepted_response(data)
 
                 if not isinstance(response, dict):
                     continue
 
-                # Check search.modules.channels - this might contain channel names
-                if "search.modules.channels" in url and response.get("ok"):
-                    logger.debug("Processing search.modules.channels response")
-                    if "channels" in response:
-                        search_channels = response["channels"]
-                        if isinstance(search_channels, list):
-                            for ch in search_channels:
-                                if isinstance(ch, dict):
-                                    ch_id = ch.get("id", "")
-                                    ch_name = ch.get("name", "")
-                                    if ch_id and ch_name:
-                                        channels[ch_id] = f"#{ch_name}"
-                                        logger.debug("Found search channel: %s -> #%s", ch_id, ch_name)
-
-                # Check client.counts response - it showed 4 channels
-                if "client.counts" in url and response.get("ok"):
-                    logger.debug("Processing client.counts response")
-                    if "channels" in response:
-                        counts_channels = response["channels"]
-                        if isinstance(counts_channels, dict):
-                            for ch_id, ch_data in counts_channels.items():
-                                if isinstance(ch_data, dict):
-                                    ch_name = ch_data.get("name", "")
-                                    if ch_name:
-                                        channels[ch_id] = f"#{ch_name}"
-                                        logger.debug("Found counts channel: %s -> #%s", ch_id, ch_name)
-                                    else:
-                                        # Try other fields that might contain the name
-                                        fields_to_try = [
-                                            "display_name",
-                                            "real_name",
-                                            "canonical_name"
-                                        ]
-                                        for field in fields_to_try:
-                                            if field in ch_data:
-                                                ch_name = ch_data[field]
-                                                if ch_name:
-                                                    channels[ch_id] = f"#{ch_name}"
-                                                    logger.debug("Found counts channel (%s): %s -> #%s", field, ch_id, ch_name)
-                                                    break
-                        elif isinstance(counts_channels, list):
-                            for ch in counts_channels:
-                                if isinstance(ch, dict):
-                                    ch_id = ch.get("id", "")
-                                    ch_name = ch.get("name", "")
-                                    if ch_id and ch_name:
-                                        channels[ch_id] = f"#{ch_name}"
-                                        logger.debug("Found counts channel (list): %s -> #%s", ch_id, ch_name)
-
-                # Check client.userBoot and client.counts for comprehensive channel data
-                if "client.userBoot" in url and response.get("ok"):
-                    logger.debug("Processing client.userBoot response")
-                    # Look for channels in various structures
-                    for key in ["channels", "ims", "groups", "team"]:
-                        if key in response:
-                            data_section = response[key]
-                            if isinstance(data_section, dict):
-                                if key == "team" and "channels" in data_section:
-                                    # Team channels structure
-                                    team_channels = data_section["channels"]
-                                    if isinstance(team_channels, dict):
-                                        for ch_id, ch_data in team_channels.items():
-                                            if isinstance(ch_data, dict):
-                                                ch_name = ch_data.get("name", "")
-                                                if ch_name:
-                                                    channels[ch_id] = f"#{ch_name}"
-                                                    logger.debug("Found team channel: %s -> #%s", ch_id, ch_name)
-                                elif key == "channels":
-                                    # Direct channels structure
-                                    if isinstance(data_section, dict):
-                                        for ch_id, ch_data in data_section.items():
-                                            if isinstance(ch_data, dict):
-                                                ch_name = ch_data.get("name", "")
-                                                if ch_name:
-                                                    channels[ch_id] = f"#{ch_name}"
-                                                    logger.debug("Found direct channel: %s -> #%s", ch_id, ch_name)
-                                    elif isinstance(data_section, list):
-                                        for ch_data in data_section:
-                                            if isinstance(ch_data, dict):
-                                                ch_id = ch_data.get("id", "")
-                                                ch_name = ch_data.get("name", "")
-                                                if ch_id and ch_name:
-                                                    channels[ch_id] = f"#{ch_name}"
-                                                    logger.debug("Found list channel: %s -> #%s", ch_id, ch_name)
-
-                # Check team.info response - might contain channel information
-                if "team.info" in url and response.get("ok"):
-                    logger.debug("Processing team.info response")
-                    if "team" in response:
-                        team_data = response["team"]
-                        if isinstance(team_data, dict) and "channels" in team_data:
-                            team_channels = team_data["channels"]
-                            if isinstance(team_channels, dict):
-                                for ch_id, ch_data in team_channels.items():
-                                    if isinstance(ch_data, dict):
-                                        ch_name = ch_data.get("name", "")
-                                        if ch_name:
-                                            channels[ch_id] = f"#{ch_name}"
-                                            logger.debug("Found team.info channel: %s -> #%s", ch_id, ch_name)
-
-                # Check conversations.list and channels.list
-                endpoints = ["conversations.list", "channels.list"]
-                if any(endpoint in url for endpoint in endpoints) and response.get("ok"):
-                    for channel in response.get("channels", []):
-                        if isinstance(channel, dict):
-                            channel_id = channel.get("id")
-                            channel_name = channel.get("name")
-                            if channel_id and channel_name:
-                                channels[channel_id] = f"#{channel_name}"
-                                logger.debug("Found API channel: %s -> #%s", channel_id, channel_name)
-
-                # Check for channel data in client.boot
-                if "client.boot" in url and response.get("ok"):
-                    team = response.get("team", {})
-                    if isinstance(team, dict):
-                        team_channels = team.get("channels", {})
-                        if isinstance(team_channels, dict):
-                            for channel_id, channel_data in team_channels.items():
-                                if isinstance(channel_data, dict):
-                                    channel_name = channel_data.get("name")
-                                    if channel_name:
-                                        channels[channel_id] = f"#{channel_name}"
-                                        logger.debug("Found boot channel: %s -> #%s", channel_id, channel_name)
+                if response.get("ok"):
+                    for endpoint, path, name_fields in _CHANNEL_SOURCES:
+                        if endpoint not in url:
+                            continue
+                        node = response
+                        for key in path:
+                            node = node.get(key) if type(node) is dict else None
+                        for ch_id, ch_name in _iter_named_channels(node, name_fields):
+                            channels[ch_id] = f"#{ch_name}"
+                            if debug_enabled:
+                                logger.debug("Found %s channel: %s -> #%s", endpoint, ch_id, ch_name)
 
                 # Check individual conversations in responses
-                if "conversations" in response and isinstance(response["conversations"], list):
-                    for conv in response["conversations"]:
-                        if isinstance(conv, dict):
-                            conv_id = conv.get("id")
-                            conv_name = conv.get("name")
-                            if conv_id and conv_name:
-                                channels[conv_id] = f"#{conv_name}"
-                                logger.debug("Found conv channel: %s -> #%s", conv_id, conv_name)
+                for conv_id, conv_name in _iter_named_channels(response.get("conversations"), ("name",)):
+                    channels[conv_id] = f"#{conv_name}"
+                    if debug_enabled:
+                        logger.debug("Found conv channel: %s -> #%s", conv_id, conv_name)
 
             print(f"✅ Found {ansi.green}{len(channels)}{ansi.reset} channels")
             logger.info("Channel discovery completed: %d channels found", len(channels))
@@ -1059,27 +1198,32 @@ class SlackBrowser:
                                 # Broaden placeholder detection beyond '#channel_'
                 placeholder_ids = []
                 for cid, cname in channels.items():
-                    if not cname:
-                        placeholder_ids.append(cid)
-                        continue
-                    lower = cname.lower()
                     # Strip leading # for easier checks
-                    stripped = lower.lstrip("#")
+                    stripped = cname.lstrip("#").lower()
                     if (
-                        stripped.startswith(("channel_", "group_"))
-                        or stripped == cid.lower()  # name is literally the ID
-                        or (stripped.startswith(("c", "g")) and len(stripped) == len(cid))
-                        or cname in {"#", ""}
+                        not stripped  # empty or a bare "#"
+                        or stripped.startswith(_PLACEHOLDER_PREFIXES)
+                        or (len(stripped) == len(cid) and (
+                            stripped == cid.lower()  # name is literally the ID
+                            or stripped.startswith(_ID_LIKE_PREFIXES)
+                        ))
                     ):
                         placeholder_ids.append(cid)
 
-                for cid in placeholder_ids:
-                    info = self._api_post_sync("conversations.info", {"channel": cid})
-                    if info.get("ok") and isinstance(info.get("channel"), dict):
-                        real_name = info["channel"].get("name") or info["channel"].get("normalized_name")
-                        if real_name:
+                # Resolve concurrently on worker threads, a bounded number in flight
+                slots = asyncio.Semaphore(self.CHANNEL_INFO_CONCURRENCY)
+
+                async def _resolve(cid: str):
+                    async with slots:
+                        info = await asyncio.to_thread(self._resolve_channel_info, cid)
+                    return cid, info
+
+                for cid, info in await asyncio.gather(*(_resolve(cid) for cid in placeholder_ids)):
+                    if info.get("ok") and type(ch := info.get("channel")) is dict:
+                        if real_name := ch.get("name") or ch.get("normalized_name"):
                             channels[cid] = f"#{real_name}"
-                            logger.debug("Resolved placeholder channel name: %s -> #%s", cid, real_name)
+                            if debug_enabled:
+                                logger.debug("Resolved placeholder channel name: %s -> #%s", cid, real_name)
 
         except (IOError, OSError) as e:
             print(f"❌ Error loading channels: {e}")
@@ -1105,6 +1249,7 @@ class SlackBrowser:
         self.channel_mappings = channels
 
         # Navigate to channels page to trigger channel list API calls
+        intercepted_before = self._intercept_count
         try:
             print("🔍 Navigating to channels page to get channel data...")
             url = f"https://app.slack.com/client/{self.settings.team_id}/browse-channels"
@@ -1115,10 +1260,11 @@ class SlackBrowser:
             await self.page.goto(f"https://app.slack.com/client/{self.settings.team_id}/channels", timeout=10000)
             await self.page.wait_for_timeout(3000)
 
-            # Refresh channel mappings after navigation
-            print("🔍 Refreshing channel mappings after navigation...")
-            channels = await self.get_channel_list()
-            self.channel_mappings = channels
+            # Refresh channel mappings only if navigation captured new API data
+            if self._intercept_count != intercepted_before:
+                print("🔍 Refreshing channel mappings after navigation...")
+                channels = await self.get_channel_list()
+                self.channel_mappings = channels
 
         except (TimeoutError, Error) as e:
             print(f"⚠️  Error navigating to channels page: {e}")
@@ -1127,11 +1273,11 @@ class SlackBrowser:
 
         # Debug: Log API response data
         logger.debug("Found %d intercepted API calls for conversation discovery", len(self.intercepted_data))
-        for data in self.intercepted_data[-10:]:  # Log last 10 calls
+        for data in list(self.intercepted_data)[-10:]:  # Log last 10 calls
             url = data.get("url", "")
             if "client.userBoot" in url or "client.counts" in url or "conversations" in url:
                 logger.debug("Processing API response: %s", url)
-                response = data.get("response", {})
+                response = _intercepted_response(data)
                 if isinstance(response, dict):
                     logger.debug("Response keys: %s", list(response.keys()))
                     if "channels" in response:
@@ -1143,33 +1289,19 @@ class SlackBrowser:
         # Extract conversations from intercepted data
         for data in self.intercepted_data:
             url = data.get("url", "")
-            response = data.get("response", {})
+            response = _intercepted_response(data)
 
             if not isinstance(response, dict):
                 continue
 
-            # Check various API endpoints that might contain conversation data
-            conversation_endpoints = [
-                "conversations.list",
-                "conversations.info",
-                "channels.list",
-                "channels.info",
-                "im.list",
-                "groups.list",
-                "client.counts",
-                "client.boot",
-                "client.userBoot",
-                "search.modules.people",
-                "conversations.genericInfo"
-            ]
-
             # Extract conversations from different API responses
-            if any(endpoint in url for endpoint in conversation_endpoints) and response.get("ok"):
+            if response.get("ok") and _CONVERSATION_ENDPOINT_RE.search(url):
                 # Handle conversations.list, channels.list, etc.
+                # json.loads only produces dict/list, not subclasses
                 for list_key in ["conversations", "channels", "ims", "groups"]:
-                    if list_key in response and isinstance(response[list_key], list):
+                    if list_key in response and type(response[list_key]) is list:
                         for conv_data in response[list_key]:
-                            if isinstance(conv_data, dict):
+                            if type(conv_data) is dict:
                                 conv_info = self._parse_conversation_data(conv_data)
                                 if conv_info:
                                     conversations[conv_info.name] = conv_info
@@ -1180,18 +1312,18 @@ class SlackBrowser:
                     for key in ["channels", "ims", "groups", "conversations"]:
                         if key in response:
                             conv_data = response[key]
-                            if isinstance(conv_data, dict):
+                            if type(conv_data) is dict:
                                 # Handle dict format (user_id: data)
                                 for conv_id, conv_info in conv_data.items():
-                                    if isinstance(conv_info, dict):
+                                    if type(conv_info) is dict:
                                         conv_info["id"] = conv_id
                                         parsed_conv = self._parse_conversation_data(conv_info)
                                         if parsed_conv:
                                             conversations[parsed_conv.name] = parsed_conv
-                            elif isinstance(conv_data, list):
+                            elif type(conv_data) is list:
                                 # Handle list format
                                 for conv_info in conv_data:
-                                    if isinstance(conv_info, dict):
+                                    if type(conv_info) is dict:
                                         parsed_conv = self._parse_conversation_data(conv_info)
                                         if parsed_conv:
                                             conversations[parsed_conv.name] = parsed_conv
@@ -1199,36 +1331,30 @@ class SlackBrowser:
                 # Handle im.list specifically
                 if "im.list" in url and "ims" in response:
                     for im_data in response["ims"]:
-                        if isinstance(im_data, dict):
+                        if type(im_data) is dict:
                             conv_info = self._parse_conversation_data(im_data)
                             if conv_info:
                                 conversations[conv_info.name] = conv_info
 
         # Create fallback conversations for known channels from processed directories
-        processed_dir = os.path.join(os.path.dirname(__file__), 'processed')
-        if os.path.exists(processed_dir):
-            for item in os.listdir(processed_dir):
-                item_path = os.path.join(processed_dir, item)
-                if os.path.isdir(item_path) and item not in conversations:
-                    # Create a fallback ConversationInfo
-                    if item.startswith('sb-'):
-                        conv_type = ConversationType.CHANNEL
-                        name = f"#{item}"
-                    elif item.startswith('dm_'):
-                        conv_type = ConversationType.DM
-                        name = f"@{item}"
-                    else:
-                        conv_type = ConversationType.UNKNOWN
-                        name = item
-
-                    conversations[name] = ConversationInfo(
-                        name=name,
-                        conversation_id=item,
-                        conversation_type=conv_type,
-                        is_private=False,
-                        member_count=0,
-                        members=[]
-                    )
+        # conversations is keyed by display name (#sb-foo, @dm_bar), so also match
+        # directory names against known IDs and the decorated forms
+        existing_ids = {conv.id for conv in conversations.values()}
+        for item in self._processed_subdirs(_PROCESSED_DIR):
+            if not (item in existing_ids or item in conversations
+                    or f"#{item}" in conversations or f"@{item}" in conversations):
+                # Create a fallback ConversationInfo
+                if item.startswith('sb-'):
+                    conv_type = ConversationType.CHANNEL
+                    name = f"#{item}"
+                elif item.startswith('dm_'):
+                    conv_type = ConversationType.DM
+                    name = f"@{item}"
+                else:
+                    conv_type = ConversationType.UNKNOWN
+                    name = item
+
+                conversations[name] = ConversationInfo(name, item, conv_type)
 
         print(f"✅ Found {len(conversations)} conversations")
         return conversations
@@ -1316,23 +1442,23 @@ class SlackBrowser:
 
         # Build headers & multipart body (Slack still accepts form-data)
         boundary = "----WebKitFormBoundary" + hex(int(time.time()*1000))[2:]
-        cookie_header = "; ".join(f"{k}={v}" for k, v in self.credentials.cookies.items())
         headers = {
-            "cookie": cookie_header,
+            "cookie": self.credentials.cookie_header(),
             "content-type": f"multipart/form-data; boundary={boundary}",
             "user-agent": "Mozilla/5.0",
             "accept": "*/*",
         }
 
-        def _multipart(payload: dict) -> str:
+        boundary_line = f"--{boundary}\r\n".encode("ascii")
+        closing_line = f"--{boundary}--".encode("ascii")
+
+        def _multipart(payload: dict) -> bytes:
             parts = []
             for k, v in payload.items():
-                parts.append(f"--{boundary}")
-                parts.append(f'Content-Disposition: form-data; name="{k}"')
-                parts.append("")
-                parts.append(str(v))
-            parts.append(f"--{boundary}--")
-            return "\r\n".join(parts)
+                parts.append(boundary_line)
+                parts.append(f'Content-Disposition: form-data; name="{k}"\r\n\r\n{v}\r\n'.encode("utf-8"))
+            parts.append(closing_line)
+            return b"".join(parts)
 
         domain = self.settings.url.split("//")[-1]
         url = f"https://{domain}/api/conversations.history"
@@ -1349,7 +1475,7 @@ class SlackBrowser:
             }
             if cursor:
                 payload["cursor"] = cursor
-            resp = requests.post(url, headers=headers, data=_multipart(payload), timeout=30)
+            resp = self._http.post(url, headers=headers, data=_multipart(payload), timeout=30)
             resp.raise_for_status()
             data = resp.json()
             if not data.get("ok"):
@@ -1464,7 +1590,7 @@ class SlackBrowser:
             initial_message_count = 0
             for data in self.intercepted_data:
                 if "conversations.history" in data["url"]:
-                    response = data.get("response", {})
+                    response = _intercepted_response(data)
                     if response.get("ok"):
                         initial_message_count += len(response.get("messages", []))
 
@@ -1490,7 +1616,7 @@ class SlackBrowser:
 
                     for data in self.intercepted_data:
                         if "conversations.history" in data["url"]:
-                            response = data.get("response", {})
+                            response = _intercepted_response(data)
                             if response.get("ok"):
                                 messages = response.get("messages", [])
                                 current_message_count += len(messages)
@@ -1603,7 +1729,7 @@ class SlackBrowser:
                         oldest_message_found = False
                         for data in self.intercepted_data:
                             if "conversations.history" in data["url"]:
-                                response = data.get("response", {})
+                                response = _intercepted_response(data)
                                 if response.get("ok"):
                                     messages = response.get("messages", [])
                                     for msg in messages:
@@ -1654,7 +1780,7 @@ class SlackBrowser:
                 has_potential_threads = False
                 for data in self.intercepted_data:
                     if "conversations.history" in data["url"]:
-                        response = data.get("response", {})
+                        response = _intercepted_response(data)
                         if response.get("ok"):
                             messages = response.get("messages", [])
                             for msg in messages:
@@ -1822,7 +1948,7 @@ class SlackBrowser:
 
                     # Handle main conversation history
                     if "conversations.history" in url:
-                        response = data.get("response", {})
+                        response = _intercepted_response(data)
                         if response.get("ok"):
                             messages = response.get("messages", [])
                             for msg in messages:
@@ -1831,7 +1957,7 @@ class SlackBrowser:
 
                     # Handle thread replies
                     elif "conversations.replies" in url:
-                        response = data.get("response", {})
+                        response = _intercepted_response(data)
                         if response.get("ok"):
                             messages = response.get("messages", [])
                             # Skip the first message (parent) and add replies
@@ -1846,7 +1972,7 @@ class SlackBrowser:
                         "files.info",
                         "reactions.get"
                     ]):
-                        response = data.get("response", {})
+                        response = _intercepted_response(data)
                         if response.get("ok"):
                             # Extract any message data from these endpoints
                             if "message" in response:
@@ -1905,8 +2031,10 @@ class SlackBrowser:
         # 1) Gather from intercepted bootstrap payloads
         # ------------------------------------------------------------------
         for data in self.intercepted_data:
-            resp = data.get("response", {})
-            if "client.userBoot" in data.get("url", "") and isinstance(resp, dict):
+            if "client.userBoot" not in data.get("url", ""):
+                continue
+            resp = _intercepted_response(data)
+            if isinstance(resp, dict):
                 for uid, info in resp.get("users", {}).items():
                     if not uid:
                         continue
@@ -1971,6 +2099,14 @@ class SlackBrowser:
         """Close browser and save credentials."""
         await self._save_storage_state_if_enabled()
         await self.save_credentials()
+        for worker in self._event_workers:
+            worker.cancel()
+        for context in self._pool_contexts:
+            try:
+                await context.close()
+            except Error:
+                pass
+        self._http.close()
         if self.browser:
             await self.browser.close()
 
@@ -2175,7 +2311,7 @@ class SlackBrowser:
                     continue
                 name_plain = cname.lstrip("#")
                 # Skip obvious placeholders
-                if name_plain.lower().startswith(("channel_", "group_")) or name_plain.lower() == cid.lower():
+                if name_plain.lower().startswith(_PLACEHOLDER_PREFIXES) or name_plain.lower() == cid.lower():
                     continue
                 if cid not in existing or existing[cid] != name_plain:
                     existing[cid] = name_plain
@@ -2189,6 +2325,33 @@ class SlackBrowser:
         except (IOError, json.JSONDecodeError) as exc:
             logger.warning("Error saving channel map: %s", exc)
 
+    def _load_channels_listing_cache(self) -> Optional[Dict[str, str]]:
+        """Return the cached conversations.list result for this workspace, if still fresh."""
+        try:
+            data = _json_loads(CHANNELS_LISTING_FILE.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(data, dict)
+            or data.get("team_id") != self.settings.team_id
+            or not time.time() - data.get("ts", 0) < _CHANNELS_LISTING_TTL
+        ):
+            return None
+        channels = data.get("channels")
+        return channels if isinstance(channels, dict) else None
+
+    def _save_channels_listing_cache(self, channels: Dict[str, str]) -> None:
+        """Persist a complete conversations.list result with the current timestamp."""
+        try:
+            CHANNELS_LISTING_FILE.parent.mkdir(parents=True, exist_ok=True)
+            CHANNELS_LISTING_FILE.write_bytes(_json_dumps({
+                "team_id": self.settings.team_id,
+                "ts": time.time(),
+                "channels": channels,
+            }))
+        except OSError as exc:
+            logger.warning("Error saving channels listing cache: %s", exc)
+
     #  Helper: lightweight Web-API POST using captured creds              #
     # ------------------------------------------------------------------ #
     def _api_post_sync(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -2202,22 +2365,46 @@ class SlackBrowser:
 
         payload = {**payload, "token": self.credentials.token}
 
-        cookie_header = "; ".join(f"{k}={v}" for k, v in self.credentials.cookies.items())
         headers = {
-            "cookie": cookie_header,
+            "cookie": self.credentials.cookie_header(),
             "user-agent": "Mozilla/5.0",
             "content-type": "application/x-www-form-urlencoded;charset=UTF-8",
             "accept": "application/json, text/plain, */*",
         }
 
         try:
-            r = requests.post(url, headers=headers, data=payload, timeout=30)
+            r = self._http.post(url, headers=headers, data=payload, timeout=30)
             r.raise_for_status()
             return r.json()
         except requests.exceptions.RequestException as exc:
             logger.error("API call %s failed: %s", endpoint, exc)
             return {}
 
+    def _processed_subdirs(self, processed_dir: str) -> List[str]:
+        """Names of the subdirectories of processed_dir, or [] if it does not exist.
+
+        One scandir pass; reused until the directory's mtime changes.
+        """
+        try:
+            key = (processed_dir, os.stat(processed_dir).st_mtime_ns)
+        except OSError:
+            return []
+        if self._processed_dir_cache and self._processed_dir_cache[0] == key:
+            return self._processed_dir_cache[1]
+        with os.scandir(processed_dir) as entries:
+            names = [entry.name for entry in entries if entry.is_dir()]
+        self._processed_dir_cache = (key, names)
+        return names
+
+    def _resolve_channel_info(self, channel_id: str) -> Dict[str, Any]:
+        """conversations.info for a channel, answered from the session cache when possible."""
+        info = self._channel_info_cache.get(channel_id)
+        if info is None:
+            info = self._api_post_sync("conversations.info", {"channel": channel_id})
+            if info.get("ok"):
+                self._channel_info_cache[channel_id] = info
+        return info
+
     def _get_dm_participants_sync(self, channel_id: str, users: Dict[str, str]) -> List[str]:
         """Return display names for all participants in a DM/MPDM channel."""
         info = self._api_post_sync("conversations.info", {"channel": channel_id})
@@ -2444,9 +2631,9 @@ def _markdown_line(msg: Dict[str, Any], users: Dict[str, str]) -> str:
 
             # Add fields if present
             if attachment.get("fields"):
-                for field in attachment["fields"]:
-                    field_title = field.get("title", "")
-                    field_value = field.get("value", "")
+                for attachment_field in attachment["fields"]:
+                    field_title = attachment_field.get("title", "")
+                    field_value = attachment_field.get("value", "")
                     if field_title and field_value:
                         attachment_parts.append(f"**{field_title}:** {field_value}")
 
@@ -0,0 +1,218 @@
+"""
+Tests for the Facebook configuration loader in `growthkit.connectors.facebook.engine`.
+
+Each test writes its own `facebook.ini` under tmp_path and clears the module
+cache so results don't leak between tests.
+"""
+
+import os
+from pathlib import Path
+from configparser import ConfigParser
+
+import pytest
+
+from growthkit.connectors.facebook import engine, _fastini
+from growthkit.connectors.facebook.schema import Page, Token
+
+
+INI_TEXT = """[app]
+app_id = 12345
+app_secret = s3cret
+api_version = v23.0
+
+[token]
+access_token = SHORT_TOKEN
+
+[page]
+page_id = 987
+page_name = Acme
+"""
+
+
+@pytest.fixture(name="ini")
+def _ini(tmp_path):
+    path = tmp_path / "facebook.ini"
+    path.write_text(INI_TEXT, encoding="utf-8")
+    engine.load.cache_clear()
+    yield path
+    engine.load.cache_clear()
+
+
+def test_load_applies_ini_overrides(ini):
+    cfg = engine.load(ini)
+    assert cfg.app.app_id == "12345"
+    assert cfg.app.app_secret == "s3cret"
+    assert cfg.token.access_token == "SHORT_TOKEN"
+    assert cfg.page.page_id == "987"
+    assert cfg.page.page_name == "Acme"
+    # Fields not present in the INI keep their dataclass defaults
+    assert cfg.page.category is None
+
+
+def test_load_returns_independent_copies(ini):
+    first = engine.load(ini)
+    first.app.app_id = "mutated"
+    second = engine.load(ini)
+    assert second.app.app_id == "12345"
+
+
+def test_load_rereads_when_file_changes(ini):
+    assert engine.load(ini).page.page_name == "Acme"
+
+    ini.write_text(INI_TEXT.replace("Acme", "Globex Corp"), encoding="utf-8")
+    st = ini.stat()
+    os.utime(ini, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert engine.load(ini).page.page_name == "Globex Corp"
+
+
+def test_fast_reader_matches_configparser(ini):
+    cp = ConfigParser()
+    cp.read(ini, encoding="utf-8")
+    expected = [(s, k, v) for s in cp.sections() for k, v in cp.items(s)]
+    assert list(_fastini.parse(ini.read_bytes())) == expected
+
+
+def test_fast_reader_handles_crlf_and_non_ascii(tmp_path):
+    path = tmp_path / "facebook.ini"
+    path.write_bytes(INI_TEXT.replace("Acme", "Café Acme").replace("\n", "\r\n").encode("utf-8"))
+    engine.load.cache_clear()
+    cfg = engine.load(path)
+    assert cfg.page.page_name == "Café Acme"
+    assert cfg.app.api_version == "v23.0"
+
+
+def test_load_falls_back_for_unsupported_syntax(ini):
+    ini.write_text(INI_TEXT.replace("app_secret = s3cret", "app_secret: s3cret"),
+                   encoding="utf-8")
+    assert engine.load(ini).app.app_secret == "s3cret"
+
+
+def _populated_manager(storage_dir):
+    tm = engine.TokenManager(storage_dir)
+    tm.update_user_config(
+        user_id="42",
+        user_name="Ada",
+        short_lived_token="short",
+        long_lived_token=Token(access_token="long", expires_at=2_000_000_000,
+                               expires_in=5_184_000, token_type="bearer"),
+    )
+    tm.add_page_config("987", Page(page_id="987", page_name="Café Acme", category="Retail",
+                                   page_access_token=Token(access_token="page-tok")))
+    return tm
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_token_manager_round_trip(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(engine, "orjson", None)
+    elif engine.orjson is None:
+        pytest.skip("orjson not installed")
+
+    saved = _populated_manager(tmp_path).save_run_data()
+
+    loaded = engine.TokenManager(tmp_path)
+    loaded.load_run_data(saved)
+    assert loaded.user_config.user_id == "42"
+    assert loaded.user_config.long_lived_token == Token(
+        access_token="long", expires_at=2_000_000_000, expires_in=5_184_000, token_type="bearer")
+    page = loaded.get_page_config("987")
+    assert page.page_name == "Café Acme"
+    assert page.page_access_token.access_token == "page-tok"
+
+
+def test_run_file_listing_orders_newest_first(tmp_path):
+    tm = engine.TokenManager(tmp_path)
+    assert tm.get_latest_run_file() is None
+
+    for stamp in ("2025-01-02-000000", "2025-03-01-120000", "2025-02-14-093000"):
+        (tmp_path / f"tokens-{stamp}.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+
+    assert tm.get_latest_run_file() == str(tmp_path / "tokens-2025-03-01-120000.json")
+    assert [Path(p).name for p in tm.list_run_files()] == [
+        "tokens-2025-03-01-120000.json",
+        "tokens-2025-02-14-093000.json",
+        "tokens-2025-01-02-000000.json",
+    ]
+
+    # Once a run is saved, the latest snapshot wins over legacy per-run files
+    tm.save_run_data()
+    assert tm.get_latest_run_file() == str(tm.current_file)
+    assert len(tm.list_run_files()) == 3
+
+
+def test_run_id_is_utc_and_matches_metadata(tmp_path):
+    tm = engine.TokenManager(tmp_path)
+    assert tm.current_run_timestamp.endswith("Z")
+    assert tm.run_metadata["run_id"] == tm.current_run_timestamp
+    assert tm.run_metadata["created_at"].endswith("+00:00")
+
+
+def test_token_expiry_accepts_shared_now():
+    token = Token(access_token="t", expires_at=1_000)
+    assert not token.is_expired(now=999.5)
+    assert token.is_expired(now=1_000)
+    assert token.time_until_expiry(now=400) == 600
+    assert token.time_until_expiry(now=2_000) == 0
+    assert not Token(access_token="t").is_expired(now=10**12)
+
+
+def test_save_appends_to_run_log(tmp_path):
+    first = _populated_manager(tmp_path)
+    first.save_run_data()
+    second = engine.TokenManager(tmp_path)
+    second.update_user_config(user_id="43", user_name="Grace")
+    second.save_run_data()
+
+    history = second.load_run_history()
+    assert [run["user_config"]["user_id"] for run in history] == ["43", "42"]
+    assert history[1]["page_configs"]["987"]["page_name"] == "Café Acme"
+
+    latest = engine.TokenManager(tmp_path)
+    latest.load_run_data(latest.get_latest_run_file())
+    assert latest.user_config.user_name == "Grace"
+
+
+def test_page_columns_overwrite_and_summary(tmp_path):
+    tm = _populated_manager(tmp_path)
+    tm.add_page_config("555", Page(page_id="555", page_name=None, category="Media"))
+    tm.add_page_config("987", Page(page_id="987", page_name="Acme Renamed"))
+
+    assert list(tm.page_configs) == ["987", "555"]
+    assert tm.get_page_config("987").page_name == "Acme Renamed"
+    assert tm.get_page_config("missing") is None
+
+    summary = tm.get_summary()
+    assert summary["page_count"] == 2
+    assert summary["page_names"] == ["Acme Renamed"]
+
+
+@pytest.mark.parametrize("raw", ["", "   ", "None", "none", " null "])
+def test_cast_treats_null_sentinels_as_none(raw):
+    assert engine._cast(str, raw) is None
+
+
+def test_cast_keeps_regular_values():
+    assert engine._cast(str, "nullable") == "nullable"
+    assert engine._cast(str, " value ") == " value "
+
+
+@pytest.mark.parametrize("count", [2, 64])
+def test_load_many_preserves_order(tmp_path, count):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"tokens-2025-01-01-{i:06d}.json"
+        path.write_text(f'{{"metadata": {{"run_id": "{i}"}}}}', encoding="utf-8")
+        paths.append(str(path))
+
+    runs = engine.TokenManager.load_many(paths)
+    assert [run["metadata"]["run_id"] for run in runs] == [str(i) for i in range(count)]
+
+
+def test_load_leaves_defaults_prototype_untouched(ini):
+    cfg = engine.load(ini)
+    cfg.page.category = "mutated"
+    assert engine._DEFAULTS.app.app_id == "YOUR_APP_ID_HERE"
+    assert engine._DEFAULTS.page.category is None
+    assert engine.load(ini).page.category is None
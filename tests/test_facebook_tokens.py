@@ -0,0 +1,164 @@
+"""
+Tests for pure helpers in `growthkit.connectors.facebook.tokens`.
+
+The module loads `config/facebook/facebook.ini` relative to the working
+directory at import time, so we chdir to a temp directory containing a
+minimal INI before importing it. No network calls are made.
+"""
+
+import json
+import importlib
+
+import pytest
+
+
+INI_TEXT = """[app]
+app_id = 12345
+app_secret = s3cret
+api_version = v23.0
+
+[token]
+access_token = SHORT_TOKEN
+
+[page]
+page_id = 987
+page_name = Acme
+"""
+
+
+@pytest.fixture(name="tokens")
+def _tokens(tmp_path, monkeypatch):
+    ini = tmp_path / "config" / "facebook" / "facebook.ini"
+    ini.parent.mkdir(parents=True)
+    ini.write_text(INI_TEXT, encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    return importlib.import_module("growthkit.connectors.facebook.tokens")
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://g/v1/x?access_token=T", "https://g/v1/x"),
+    ("https://g/v1/x?access_token=T&after=A%3D", "https://g/v1/x?after=A%3D"),
+    ("https://g/v1/x?limit=25&access_token=T&after=A", "https://g/v1/x?limit=25&after=A"),
+    ("https://g/v1/x?limit=25&access_token=T", "https://g/v1/x?limit=25"),
+    ("https://g/v1/x?limit=25", "https://g/v1/x?limit=25"),
+])
+def test_strip_token(tokens, url, expected):
+    assert tokens._strip_token(url) == expected
+
+
+def test_with_token_picks_separator(tokens):
+    assert tokens._with_token("https://g/x", "T") == "https://g/x?access_token=T"
+    assert tokens._with_token("https://g/x?a=1", "T") == "https://g/x?a=1&access_token=T"
+
+
+def test_make_batch_request_demuxes_and_chunks(tokens, monkeypatch):
+    posted = []
+
+    def fake_request(url, data=None, permits=1):
+        batch = json.loads(data["batch"])
+        assert permits == len(batch)
+        posted.append(len(batch))
+        return [
+            {"code": 200, "body": json.dumps({"id": sub["relative_url"]})}
+            if not sub["relative_url"].startswith("bad") else {"code": 400, "body": "{}"}
+            for sub in batch
+        ]
+
+    monkeypatch.setattr(tokens, "make_api_request", fake_request)
+    urls = [f"p{i}" for i in range(tokens.BATCH_LIMIT + 5)] + ["bad"]
+
+    results = tokens.make_batch_request(urls, "USER_TOKEN")
+
+    assert posted == [tokens.BATCH_LIMIT, 6]
+    assert results[0] == {"id": "p0"}
+    assert results[-2] == {"id": f"p{tokens.BATCH_LIMIT + 4}"}
+    assert results[-1] is None
+
+
+def test_make_batch_request_reuses_cached_sub_responses(tokens, monkeypatch):
+    monkeypatch.setattr(tokens, "_RESPONSE_CACHE", {})
+    sent = []
+
+    def fake_request(url, data=None, permits=1):
+        batch = json.loads(data["batch"])
+        sent.append([sub["relative_url"] for sub in batch])
+        return [{"code": 200, "body": json.dumps({"url": sub["relative_url"]})} for sub in batch]
+
+    monkeypatch.setattr(tokens, "make_api_request", fake_request)
+    urls = ["p1?fields=access_token", "me", "p1/posts"]
+
+    first = tokens.make_batch_request(urls, "USER_TOKEN")
+    second = tokens.make_batch_request(urls, "USER_TOKEN")
+    tokens.make_batch_request(["me"], "OTHER_TOKEN")
+
+    assert first == second == [{"url": url} for url in urls]
+    assert sent == [urls, ["p1/posts"], ["me"]]
+
+
+def test_iter_paginated_starts_from_prefetched_page(tokens, monkeypatch, capsys):
+    requested = []
+
+    def fake_request(url, data=None):
+        requested.append(url)
+        return {"data": [{"id": "b2"}]}
+
+    monkeypatch.setattr(tokens, "make_api_request", fake_request)
+    first = {"data": [{"id": "b1"}],
+             "paging": {"next": "https://g/v1/me/businesses?after=C&access_token=OLD"}}
+
+    items = list(tokens.iter_paginated("https://g/v1/me/businesses", "NEW", first))
+
+    assert [item["id"] for item in items] == ["b1", "b2"]
+    assert requested == ["https://g/v1/me/businesses?after=C&access_token=NEW"]
+    out = capsys.readouterr().out
+    assert "Starting data collection from https://g/v1/me/businesses" in out
+    assert "PAGINATION COMPLETE: 2 total items across 2 pages" in out
+
+
+def test_rate_limiter_blocks_once_burst_is_spent(tokens, monkeypatch):
+    clock = [100.0]
+    sleeps = []
+    monkeypatch.setattr(tokens.time, "monotonic", lambda: clock[0])
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(tokens.time, "sleep", fake_sleep)
+    limiter = tokens.RateLimiter(2, 10)
+
+    limiter.acquire()
+    limiter.acquire()
+    assert not sleeps
+    limiter.acquire()
+    assert sleeps == [pytest.approx(5.0)]
+
+
+def test_rate_limiter_paces_requests_larger_than_the_burst(tokens, monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(tokens.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(tokens.time, "sleep", lambda seconds: clock.__setitem__(0, clock[0] + seconds))
+    limiter = tokens.RateLimiter(2, 10)
+
+    limiter.acquire(5)
+
+    # Two permits are in the burst; the other three take 5 seconds each
+    assert clock[0] == pytest.approx(115.0)
+
+
+def test_app_usage_header_throttles_and_recovers(tokens, monkeypatch):
+    limiter = tokens.RateLimiter(tokens.RATE_LIMIT_CALLS, tokens.RATE_LIMIT_PERIOD)
+    monkeypatch.setattr(tokens, "_LIMITER", limiter)
+
+    class FakeResponse:
+        def __init__(self, usage):
+            self.headers = {"x-app-usage": usage}
+
+    tokens._observe_app_usage(FakeResponse('{"call_count": 85, "total_time": 10}'))
+    assert limiter.max_calls == tokens.RATE_LIMIT_THROTTLED_CALLS
+
+    tokens._observe_app_usage(FakeResponse("not json"))
+    assert limiter.max_calls == tokens.RATE_LIMIT_THROTTLED_CALLS
+
+    tokens._observe_app_usage(FakeResponse('{"call_count": 20}'))
+    assert limiter.max_calls == tokens.RATE_LIMIT_CALLS
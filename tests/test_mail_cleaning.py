@@ -3,12 +3,14 @@ Tests for core, pure utilities in `growthkit.connectors.mail.gmail_sync`.
 
 - clean_subject: decodes encoded subjects and strips encoding artifacts
 - clean_email_content: removes invisible chars/whitespace noise and shortens long URLs
+- write_msg: renders a `full`-format Gmail message to markdown
 
 To avoid importing heavy optional dependencies (google APIs, markitdown),
 we stub them in sys.modules before importing the target module.
 """
 
 import sys
+import base64
 import types
 import importlib
 
@@ -34,6 +36,23 @@ def _load_gmail_sync_module():
 
     google_auth_exceptions.RefreshError = _RefreshError
 
+    # google.oauth2.credentials.Credentials
+    google_oauth2 = types.ModuleType("google.oauth2")
+    google_oauth2_credentials = types.ModuleType("google.oauth2.credentials")
+
+    class _Credentials:
+        @classmethod
+        def from_authorized_user_info(cls, *_args, **_kwargs):
+            return cls()
+
+    google_oauth2_credentials.Credentials = _Credentials
+
+    # httplib2.Http and google_auth_httplib2.AuthorizedHttp
+    httplib2 = types.ModuleType("httplib2")
+    httplib2.Http = lambda *_args, **_kwargs: object()
+    google_auth_httplib2 = types.ModuleType("google_auth_httplib2")
+    google_auth_httplib2.AuthorizedHttp = lambda *_args, **_kwargs: object()
+
     # google_auth_oauthlib.flow.InstalledAppFlow
     google_auth_oauthlib = types.ModuleType("google_auth_oauthlib")
     google_auth_oauthlib_flow = types.ModuleType("google_auth_oauthlib.flow")
@@ -81,6 +100,10 @@ def _load_gmail_sync_module():
     sys.modules.setdefault("google.auth.transport", google_auth_transport)
     sys.modules.setdefault("google.auth.transport.requests", google_auth_transport_requests)
     sys.modules.setdefault("google.auth.exceptions", google_auth_exceptions)
+    sys.modules.setdefault("google.oauth2", google_oauth2)
+    sys.modules.setdefault("google.oauth2.credentials", google_oauth2_credentials)
+    sys.modules.setdefault("httplib2", httplib2)
+    sys.modules.setdefault("google_auth_httplib2", google_auth_httplib2)
     sys.modules.setdefault("google_auth_oauthlib", google_auth_oauthlib)
     sys.modules.setdefault("google_auth_oauthlib.flow", google_auth_oauthlib_flow)
     sys.modules.setdefault("googleapiclient", googleapiclient)
@@ -144,3 +167,195 @@ def test_clean_email_content_cleanup_and_url_shortening():
     # None or empty inputs are returned sensibly
     assert gmail_sync_mod.clean_email_content(None) is None
     assert gmail_sync_mod.clean_email_content("") == ""
+
+
+def test_write_msg_reads_full_format_payload(tmp_path, monkeypatch):
+    """Text bodies are taken from the `full` MIME tree; attachments are ignored."""
+    gmail_sync_mod = _load_gmail_sync_module()
+    monkeypatch.setattr(gmail_sync_mod, "OUTDIR", tmp_path)
+
+    def b64(text):
+        return base64.urlsafe_b64encode(text.encode()).decode()
+
+    msg = {
+        "internalDate": "1727776800000",
+        "payload": {
+            "mimeType": "multipart/mixed",
+            "headers": [
+                {"name": "Subject", "value": "Quarterly numbers"},
+                {"name": "From", "value": "a@example.com"},
+                {"name": "To", "value": "b@example.com"},
+                {"name": "Date", "value": "Tue, 1 Oct 2024 10:00:00 +0000"},
+            ],
+            "body": {"size": 0},
+            "parts": [
+                {"mimeType": "multipart/alternative", "body": {"size": 0}, "parts": [
+                    {"mimeType": "text/plain", "body": {"data": b64("Hello   there\n")}},
+                    {"mimeType": "text/html", "body": {"data": b64("<p>Hello</p>")}},
+                ]},
+                {"mimeType": "text/plain", "filename": "notes.txt",
+                 "body": {"attachmentId": "ANGjdJ", "size": 2048}},
+            ],
+        },
+    }
+
+    # No raw fallback is needed, so the Gmail client is never touched
+    gmail_sync_mod.write_msg(None, "m1", msg)
+
+    (output,) = tmp_path.iterdir()
+    assert output.name.endswith("-m1.md")
+    text = output.read_text(encoding="utf-8")
+    assert "from: a@example.com" in text
+    assert "Quarterly numbers" in text
+    assert text.rstrip().endswith("Hello there")
+
+
+def test_parse_raw_skips_attachments():
+    """The raw fallback keeps inline text bodies and ignores attached files."""
+    gmail_sync_mod = _load_gmail_sync_module()
+    raw_message = (
+        "Subject: Report\r\n"
+        "From: a@example.com\r\n"
+        "Content-Type: multipart/mixed; boundary=XX\r\n\r\n"
+        "--XX\r\nContent-Type: text/plain\r\n\r\nSee attached.\r\n"
+        "--XX\r\nContent-Type: text/plain\r\n"
+        "Content-Disposition: attachment; filename=data.csv\r\n\r\na,b,c\r\n"
+        "--XX\r\nContent-Type: image/png\r\nContent-Transfer-Encoding: base64\r\n\r\niVBORw0K\r\n"
+        "--XX--\r\n"
+    )
+    raw = base64.urlsafe_b64encode(raw_message.encode()).decode()
+
+    headers, text_parts, html_parts = gmail_sync_mod._parse_raw(raw)
+
+    assert headers["subject"] == "Report"
+    assert headers["to"] is None
+    assert [part.strip() for part in text_parts] == ["See attached."]
+    assert html_parts == []
+
+
+def test_archived_message_ids_reads_export_names(tmp_path, monkeypatch):
+    """Message IDs are recovered from `<date>-<subject>-<id>.md` export names."""
+    gmail_sync_mod = _load_gmail_sync_module()
+    monkeypatch.setattr(gmail_sync_mod, "OUTDIR", tmp_path)
+    (tmp_path / "20240101-hello-world-18c2f0a1b2.md").write_text("x", encoding="utf-8")
+    (tmp_path / "20240102-re-update-18c2f0a1b3.md").write_text("x", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("x", encoding="utf-8")
+
+    assert gmail_sync_mod.archived_message_ids() == {"18c2f0a1b2", "18c2f0a1b3"}
+
+
+def _http_error(gmail_sync_mod, status):
+    """An HttpError carrying `status`, whether or not the real client is installed."""
+    error = gmail_sync_mod.HttpError(types.SimpleNamespace(status=status, reason=""), b"")
+    error.resp = types.SimpleNamespace(status=status, reason="")
+    return error
+
+
+def _patch_main(gmail_sync_mod, monkeypatch, tmp_path, gmail, results):
+    """Points main() at tmp_path and serves `results` as one fetched batch."""
+    cursor = tmp_path / "cursor.txt"
+    cursor.write_text("100", encoding="utf-8")
+    monkeypatch.setattr(gmail_sync_mod, "OUTDIR", tmp_path)
+    monkeypatch.setattr(gmail_sync_mod, "CURSOR", cursor)
+    monkeypatch.setattr(gmail_sync_mod, "RETRY_BACKOFF", 0)
+    monkeypatch.setattr(gmail_sync_mod, "get_creds", lambda: None)
+    monkeypatch.setattr(gmail_sync_mod, "build_gmail", lambda _creds: gmail)
+    monkeypatch.setattr(gmail_sync_mod, "fetch_deltas", lambda _gmail, _start: (list(results), "200"))
+    monkeypatch.setattr(gmail_sync_mod, "iter_fetched",
+                        lambda _creds, ids: iter([(ids, {mid: results[mid] for mid in ids})]))
+    return cursor
+
+
+def _text_message(subject, body):
+    return {"internalDate": "1727776800000", "payload": {
+        "mimeType": "text/plain",
+        "headers": [{"name": "Subject", "value": subject}],
+        "body": {"data": base64.urlsafe_b64encode(body.encode()).decode()},
+    }}
+
+
+def test_main_continues_when_raw_fallback_fails(tmp_path, monkeypatch):
+    """A 404 on one message's raw re-fetch is logged; the run still finishes."""
+    gmail_sync_mod = _load_gmail_sync_module()
+
+    class _Gmail:
+        def users(self):
+            return self
+
+        def messages(self):
+            return self
+
+        def get(self, **_kwargs):
+            return self
+
+        def execute(self):
+            raise _http_error(gmail_sync_mod, 404)
+
+    cursor = _patch_main(gmail_sync_mod, monkeypatch, tmp_path, _Gmail(), {
+        # No inline body, so write_msg falls back to the raw format
+        "m1": {"internalDate": "1727776800000", "payload": {"headers": []}},
+        "m2": _text_message("Kept", "Still archived"),
+    })
+
+    gmail_sync_mod.main()
+
+    assert [path.name.endswith("-m2.md") for path in tmp_path.glob("*.md")] == [True]
+    assert cursor.read_text(encoding="utf-8") == "200"
+
+
+def test_quota_limiter_splits_requests_larger_than_the_rate(monkeypatch):
+    """A request above one second's quota is paced, not left waiting forever."""
+    gmail_sync_mod = _load_gmail_sync_module()
+    clock = [0.0]
+    monkeypatch.setattr(gmail_sync_mod, "time", types.SimpleNamespace(
+        monotonic=lambda: clock[0],
+        sleep=lambda seconds: clock.__setitem__(0, clock[0] + seconds),
+    ))
+
+    limiter = gmail_sync_mod.QuotaLimiter(250)
+    limiter.acquire(500)
+
+    assert abs(clock[0] - 1.0) < 1e-9
+
+
+def test_main_retries_transient_fetch_failures(tmp_path, monkeypatch):
+    """A 429 from the concurrent pass is fetched again before the cursor moves."""
+    gmail_sync_mod = _load_gmail_sync_module()
+    cursor = _patch_main(gmail_sync_mod, monkeypatch, tmp_path, object(), {
+        "m1": _http_error(gmail_sync_mod, 429),
+        "m2": _text_message("Kept", "First pass"),
+    })
+    retried = []
+
+    def fake_fetch(_gmail, mids):
+        retried.extend(mids)
+        return {mid: _text_message("Retried", "Second pass") for mid in mids}
+
+    monkeypatch.setattr(gmail_sync_mod, "fetch_messages", fake_fetch)
+
+    gmail_sync_mod.main()
+
+    assert retried == ["m1"]
+    assert sorted(path.name[-6:] for path in tmp_path.glob("*.md")) == ["-m1.md", "-m2.md"]
+    assert cursor.read_text(encoding="utf-8") == "200"
+
+
+def test_main_keeps_cursor_when_retries_are_exhausted(tmp_path, monkeypatch):
+    """Messages that never fetch leave the cursor in place for the next run."""
+    gmail_sync_mod = _load_gmail_sync_module()
+    cursor = _patch_main(gmail_sync_mod, monkeypatch, tmp_path, object(), {
+        "m1": _http_error(gmail_sync_mod, 503),
+    })
+    attempts = []
+
+    def fake_fetch(_gmail, mids):
+        attempts.append(list(mids))
+        return {mid: _http_error(gmail_sync_mod, 503) for mid in mids}
+
+    monkeypatch.setattr(gmail_sync_mod, "fetch_messages", fake_fetch)
+
+    gmail_sync_mod.main()
+
+    assert attempts == [["m1"]] * gmail_sync_mod.RETRY_ATTEMPTS
+    assert list(tmp_path.glob("*.md")) == []
+    assert cursor.read_text(encoding="utf-8") == "100"
@@ -99,3 +99,318 @@ def test_load_workspace_settings_valid_values(tmp_path, monkeypatch):
     assert settings.url == "https://acme.slack.com"
     assert settings.team_id == "T123456"
     assert settings.app_client_url == "https://app.slack.com/client/T123456"
+
+
+def test_parse_set_cookie_skips_attributes_and_splits_joined_headers():
+    mod = _import_slack_fetcher_with_stubs()
+
+    header = (
+        "d=xoxd-abc%2F123; Path=/; Domain=.slack.com; "
+        "Expires=Wed, 21 Oct 2026 07:28:00 GMT; Secure; HttpOnly\n"
+        'lc="1700000000"; Max-Age=3600, b=.xyz; SameSite=Lax'
+    )
+    assert list(mod._parse_set_cookie(header)) == [
+        ("d", "xoxd-abc%2F123"),
+        ("lc", "1700000000"),
+        ("b", ".xyz"),
+    ]
+
+
+def test_intercepted_response_decodes_without_keeping_the_result():
+    mod = _import_slack_fetcher_with_stubs()
+
+    entry = {"url": "https://acme.slack.com/api/team.info", "response_raw": b'{"ok": true}'}
+    assert mod._intercepted_response(entry) == {"ok": True}
+    assert entry == {"url": "https://acme.slack.com/api/team.info", "response_raw": b'{"ok": true}'}
+
+    assert mod._intercepted_response({"response_raw": b"not json"}) == {}
+    assert mod._intercepted_response({}) == {}
+
+
+@pytest.mark.parametrize(
+    "url, tag",
+    [
+        ("https://acme.slack.com/api/client.boot", "api"),
+        ("https://account.slack.com/signin", "account"),
+        ("https://app.slack.com/client/T1/C1", "app"),
+        ("https://acme.slack.com/captcha?redir=/signin", "challenge"),
+        ("https://acme.slack.com/signin/verify", "signin"),
+        ("https://acme.slack.com/archives/C1", "workspace"),
+        ("https://example.com/api/login", "other"),
+        ("", "other"),
+    ],
+)
+def test_classify_slack_url(url, tag):
+    mod = _import_slack_fetcher_with_stubs()
+    browser = mod.SlackBrowser.__new__(mod.SlackBrowser)
+    assert browser._classify_slack_url(url) == tag
+
+
+def test_adopt_d_cookie_decodes_token_once_per_value(monkeypatch):
+    mod = _import_slack_fetcher_with_stubs()
+    creds = mod.SlackCredentials()
+
+    creds.adopt_d_cookie("abc%2Fdef")
+    assert creds.token == ""
+
+    calls = []
+    real_unquote = mod.urllib.parse.unquote
+    monkeypatch.setattr(mod.urllib.parse, "unquote", lambda v: calls.append(v) or real_unquote(v))
+    creds.adopt_d_cookie("abc%2Fdef")
+    assert calls == []
+
+    creds.adopt_d_cookie("%78%6Fxd-1%2F2")
+    assert creds.token == "xoxd-1/2"
+
+
+def test_credentials_round_trip(tmp_path, monkeypatch):
+    mod = _import_slack_fetcher_with_stubs()
+    monkeypatch.setattr(mod, "CREDENTIALS_FILE", tmp_path / "playwright_creds.json")
+
+    creds = mod.SlackCredentials()
+    creds.cookies = {"d": "xoxd-é"}
+    creds.token = "xoxc-1"
+    creds.team_id = "T1"
+    creds.last_updated = 12.5
+    creds.save()
+
+    loaded = mod.SlackCredentials.load()
+    assert loaded.cookies == {"d": "xoxd-é"}
+    assert (loaded.token, loaded.team_id, loaded.last_updated) == ("xoxc-1", "T1", 12.5)
+
+
+def test_conversation_info_repr():
+    mod = _import_slack_fetcher_with_stubs()
+    CT = mod.ConversationType
+
+    assert repr(mod.ConversationInfo("#general", "C1", CT.CHANNEL, True, 3)) == "#general🔒 (3 members)"
+    assert repr(mod.ConversationInfo("@ana", "D1", CT.DM)) == "@ana"
+    assert repr(mod.ConversationInfo("misc", "X1", CT.UNKNOWN)) == "?misc"
+
+
+def test_acquire_page_reuses_main_page_and_caps_concurrency():
+    import asyncio
+
+    mod = _import_slack_fetcher_with_stubs()
+
+    class _Page:
+        def on(self, event, handler):
+            pass
+
+    class _Context:
+        async def storage_state(self):
+            return {"cookies": []}
+
+        async def new_page(self):
+            return _Page()
+
+    class _Browser:
+        async def new_context(self, **kwargs):
+            return _Context()
+
+    async def run():
+        browser = mod.SlackBrowser(mod.WorkspaceSettings(url="https://acme.slack.com", team_id="T1"))
+        browser.page, browser.context, browser.browser = _Page(), _Context(), _Browser()
+        browser._idle_pages = [browser.page]
+        browser._page_slots = asyncio.Semaphore(2)
+
+        async with browser.acquire_page() as first:
+            assert first is browser.page
+            async with browser.acquire_page() as second:
+                assert second is not browser.page
+                assert browser._page_slots.locked()
+        assert len(browser._idle_pages) == 2 and len(browser._pool_contexts) == 1
+
+    asyncio.run(run())
+
+
+def test_drain_events_survives_a_failing_handler():
+    import asyncio
+
+    mod = _import_slack_fetcher_with_stubs()
+    handled = []
+
+    async def handler(event):
+        if event == "bad":
+            raise KeyError(event)
+        handled.append(event)
+
+    async def run():
+        queue = asyncio.Queue()
+        for event in ("bad", "good"):
+            queue.put_nowait(event)
+        worker = asyncio.create_task(mod.SlackBrowser._drain_events(queue, handler))
+        while handled != ["good"]:
+            await asyncio.sleep(0)
+        assert not worker.done()
+        worker.cancel()
+
+    asyncio.run(run())
+
+
+def test_parse_conversation_data_names_and_types():
+    mod = _import_slack_fetcher_with_stubs()
+    CT = mod.ConversationType
+    browser = mod.SlackBrowser.__new__(mod.SlackBrowser)
+    browser.user_mappings = {"U0000AAA": "ana"}
+    browser.channel_mappings = {"C1": "#general"}
+    browser._unknown_user_name_cache = {}
+    parse = browser._parse_conversation_data
+
+    assert parse({"name": "x"}) is None
+
+    dm = parse({"id": "D1", "user": "U0000AAA"})
+    assert (dm.name, dm.conversation_type) == ("@ana", CT.DM)
+
+    mpim = parse({"id": "D2", "is_mpim": True, "members": ["U0000AAA", "U9999BBBBBB"]})
+    assert (mpim.name, mpim.conversation_type, mpim.member_count) == ("@ana_user_BBBBBB", CT.MULTI_PERSON_DM, 2)
+    again = parse({"id": "D3", "is_mpim": True, "members": ["U9999BBBBBB"]})
+    assert again.name == "@user_BBBBBB"
+    assert browser._unknown_user_name_cache == {"U9999BBBBBB": "user_BBBBBB"}
+
+    channel = parse({"id": "C1", "name": "ignored", "num_members": 7, "is_private": True})
+    assert (channel.name, channel.conversation_type, channel.member_count, channel.is_private) == (
+        "#general", CT.CHANNEL, 7, True)
+
+    group = parse({"id": "G1"})
+    assert (group.name, group.conversation_type) == ("#group_G1", CT.MULTI_PERSON_DM)
+
+    mpdm = parse({"id": "C9", "name": "mpdm-a--b-1"})
+    assert (mpdm.name, mpdm.conversation_type) == ("@mpdm-a--b-1", CT.MULTI_PERSON_DM)
+
+
+def test_get_channel_list_merges_api_data_and_resolves_placeholders(tmp_path, monkeypatch):
+    import asyncio
+
+    mod = _import_slack_fetcher_with_stubs()
+    monkeypatch.chdir(tmp_path)
+
+    browser = mod.SlackBrowser(mod.WorkspaceSettings(url="https://acme.slack.com", team_id="T1"))
+    browser.credentials.token = "xoxc-1"
+    browser.credentials.cookies = {"d": "x"}
+    browser.intercepted_data.append({
+        "url": "https://acme.slack.com/api/client.counts",
+        "response_raw": b'{"ok": true, "channels": {"C2": {"name": ""}, "C3": {"display_name": "ops"}}}',
+    })
+
+    calls = []
+
+    def fake_post(endpoint, payload):
+        calls.append((endpoint, payload.get("channel")))
+        if endpoint == "conversations.list":
+            return {"ok": True, "channels": [{"id": "C1", "name": "general"}, {"id": "C4", "name": "c4"}]}
+        return {"ok": True, "channel": {"name": f"real-{payload['channel'].lower()}"}}
+
+    monkeypatch.setattr(browser, "_api_post_sync", fake_post)
+
+    channels = asyncio.run(browser.get_channel_list())
+
+    assert channels == {"C1": "#general", "C3": "#ops", "C4": "#real-c4"}
+    assert sorted(calls) == [("conversations.info", "C4"), ("conversations.list", None)]
+    saved = json.loads(Path("data/slack/channel_map.json").read_text(encoding="utf-8"))
+    assert saved["C4"] == "real-c4"
+
+
+def test_get_channel_list_reuses_fresh_conversations_listing(tmp_path, monkeypatch):
+    import asyncio
+
+    mod = _import_slack_fetcher_with_stubs()
+    monkeypatch.chdir(tmp_path)
+
+    browser = mod.SlackBrowser(mod.WorkspaceSettings(url="https://acme.slack.com", team_id="T1"))
+    browser.credentials.token = "xoxc-1"
+    browser.credentials.cookies = {"d": "x"}
+
+    calls = []
+
+    def fake_post(endpoint, payload):
+        calls.append(endpoint)
+        return {"ok": True, "channels": [{"id": "C1", "name": "general"}]}
+
+    monkeypatch.setattr(browser, "_api_post_sync", fake_post)
+
+    assert asyncio.run(browser.get_channel_list()) == {"C1": "#general"}
+    assert asyncio.run(browser.get_channel_list()) == {"C1": "#general"}
+    assert calls == ["conversations.list"]
+
+    asyncio.run(browser.get_channel_list(refresh=True))
+    assert calls == ["conversations.list"] * 2
+
+    # A listing cached for another workspace is ignored
+    browser.settings = mod.WorkspaceSettings(url="https://other.slack.com", team_id="T2")
+    asyncio.run(browser.get_channel_list())
+    assert calls == ["conversations.list"] * 3
+
+
+def test_resolve_channel_info_caches_successful_lookups(monkeypatch):
+    mod = _import_slack_fetcher_with_stubs()
+    browser = mod.SlackBrowser.__new__(mod.SlackBrowser)
+    browser._channel_info_cache = {}
+
+    answers = {"C1": {"ok": True, "channel": {"name": "general"}}, "C2": {"ok": False}}
+    calls = []
+    monkeypatch.setattr(browser, "_api_post_sync",
+                        lambda endpoint, payload: calls.append(payload["channel"]) or answers[payload["channel"]])
+
+    for _ in range(2):
+        assert browser._resolve_channel_info("C1")["channel"]["name"] == "general"
+        assert browser._resolve_channel_info("C2") == {"ok": False}
+    assert calls == ["C1", "C2", "C2"]
+
+
+def test_get_channel_list_walks_intercepted_channel_sources(tmp_path, monkeypatch):
+    import asyncio
+
+    mod = _import_slack_fetcher_with_stubs()
+    monkeypatch.chdir(tmp_path)
+
+    browser = mod.SlackBrowser(mod.WorkspaceSettings(url="https://acme.slack.com", team_id="T1"))
+    browser.credentials.token = ""
+    responses = {
+        "client.userBoot": {"ok": True, "channels": [{"id": "C1", "name": "general"}, {"name": "no-id"}],
+                            "ims": {"D1": {"name": "ignored"}}, "team": {"channels": {"C2": {"name": "random"}}}},
+        "client.boot": {"ok": True, "team": {"channels": {"C3": {"name": "boot"}}}},
+        "search.modules.channels": {"ok": False, "channels": [{"id": "C4", "name": "not-ok"}],
+                                    "conversations": [{"id": "C5", "name": "conv"}]},
+    }
+    for endpoint, body in responses.items():
+        browser.intercepted_data.append({
+            "url": f"https://acme.slack.com/api/{endpoint}",
+            "response_raw": json.dumps(body).encode(),
+        })
+
+    channels = asyncio.run(browser.get_channel_list())
+
+    assert channels == {"C1": "#general", "C2": "#random", "C3": "#boot", "C5": "#conv"}
+
+
+def test_processed_subdirs_lists_directories_and_reuses_scan(tmp_path, monkeypatch):
+    mod = _import_slack_fetcher_with_stubs()
+    browser = mod.SlackBrowser.__new__(mod.SlackBrowser)
+    browser._processed_dir_cache = None
+
+    assert browser._processed_subdirs(str(tmp_path / "missing")) == []
+
+    (tmp_path / "sb-general").mkdir()
+    (tmp_path / "notes.md").write_text("x", encoding="utf-8")
+    assert browser._processed_subdirs(str(tmp_path)) == ["sb-general"]
+
+    monkeypatch.setattr(mod.os, "scandir", lambda path: pytest.fail("directory rescanned"))
+    assert browser._processed_subdirs(str(tmp_path)) == ["sb-general"]
+
+
+def test_cookie_header_is_rebuilt_only_after_changes():
+    mod = _import_slack_fetcher_with_stubs()
+    creds = mod.SlackCredentials()
+    creds.cookies = {"d": "1"}
+
+    header = creds.cookie_header()
+    assert header == "d=1"
+    creds.set_cookie("d", "1")
+    assert creds.cookie_header() is header
+
+    creds.set_cookie("b", "2")
+    assert creds.cookie_header() == "d=1; b=2"
+
+    creds.cookies = {"x": "9"}
+    assert creds.cookie_header() == "x=9"